@@ -1,3 +1,7 @@
+import re
+from urllib.parse import urlparse
+
+
 class APIRoutes:
     """API route constants"""
 
@@ -40,3 +44,29 @@ class UIRoutes:
     DEPRECIATION_BASIS_ADJUSTMENT = "/depreciation/{}/configurations/basis-adjustments"
     DEPRECIATION_BONUS_PROFILE = "/depreciation/{}/configurations/bonus-profile"
     DEPRECIATION_PROFILE = "/depreciation/{}/configurations/depreciation-profile"
+
+
+def _route_pattern(template: str) -> re.Pattern[str]:
+    path = "/" + template.lstrip("/")
+    return re.compile("^" + re.escape(path).replace(re.escape("{}"), "[^/]+") + "/?$")
+
+
+_UI_ROUTE_PATTERNS = {
+    value: _route_pattern(value) for name, value in vars(UIRoutes).items() if not name.startswith("_") and isinstance(value, str)
+}
+
+
+def match_ui_route(url: str) -> str | None:
+    """Find the UIRoutes template matching the path of a URL
+
+    Args:
+        url: Full URL or path
+
+    Returns:
+        The route template, e.g. "/depreciation/{}/configurations/asset-class", or None if no route matches
+    """
+    path = urlparse(url).path or "/"
+    for template, pattern in _UI_ROUTE_PATTERNS.items():
+        if pattern.match(path):
+            return template
+    return None
@@ -21,7 +21,11 @@ def generate_random_email(domain: str = "example.com") -> str:
 
 
 def wait_for(condition_func, timeout: int = 10, poll_frequency: float = 0.5) -> bool:
-    """Wait for a condition to be true"""
+    """Wait for a condition to be true by polling
+
+    Conditions of page elements are awaited by BaseElement.should_* and wait_for_stable instead,
+    which wait on DOM mutations in the page rather than polling it.
+    """
     start_time = time.time()
     while time.time() - start_time < timeout:
         if condition_func():
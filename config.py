@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -12,6 +14,71 @@ class BaseConfig(BaseSettings):
     demo_test: bool = Field(False, description="Run tests in demo mode")
     timeout: int = Field(10000, description="Default timeout in milliseconds")
 
+    # Browser pool
+    max_contexts_per_worker: int = Field(4, description="Maximum number of browser contexts per test worker")
+    max_pages_per_context: int = Field(5, description="Maximum number of open pages per browser context")
+    max_context_heap_mb: int = Field(0, description="JS heap size in MiB above which a browser context is evicted, 0 disables the check")
+    reuse_browser: bool = Field(False, description="Connect to a browser kept running between test sessions")
+    browser_server_port: int = Field(9333, description="Remote debugging port of the reusable browser")
+    browser_executable_path: str = Field("", description="Browser executable for the reusable browser (the launch channel by default)")
+    context_pool_size: int = Field(0, description="Number of pre-warmed browser contexts, reset between test classes (0 disables)")
+
+    # Network resource blocking
+    block_resources: bool = Field(False, description="Abort requests for resources the tests never assert on")
+    blocked_resource_types: list[str] = Field(["font", "image", "media"], description="Playwright resource types to block")
+    blocked_url_patterns: list[str] = Field(
+        ["google-analytics.com", "googletagmanager.com", "hotjar.com", "segment.io", "sentry.io", "intercom.io", "fullstory.com"],
+        description="URL substrings of analytics beacons and other side requests to block",
+    )
+    block_third_party_scripts: bool = Field(True, description="Block scripts served from outside of the application domain")
+
+    # Persistent cache of static assets shared by contexts and workers
+    http_cache: bool = Field(False, description="Serve scripts, styles, fonts and images from a persistent on-disk cache")
+    http_cache_dir: str = Field(".cache/http", description="Directory of the persistent asset cache")
+    http_cache_version: str = Field(
+        "", description="App build version of the cache, detected from the asset URLs of the entry page if empty"
+    )
+
+    # Client-side navigation between routes of the loaded app
+    spa_navigation: bool = Field(False, description="Navigate with the app router when the app is already loaded")
+    spa_navigation_timeout: int = Field(
+        3000, description="Time in milliseconds to wait for a client-side navigation before a full page load"
+    )
+    spa_router_response_timeout: int = Field(
+        1000, description="Time in milliseconds for the app router to replace the previous page before a full page load"
+    )
+
+    # Navigation timing of Driver.goto
+    collect_navigation_timing: bool = Field(True, description="Record navigation timing of every Driver.goto")
+    navigation_timing_report: str = Field("reports/navigation_timing.json", description="Navigation timing report path")
+
+    # JS heap and CPU metrics of page-object actions
+    collect_page_metrics: bool = Field(False, description="Sample CDP Performance metrics around page-object actions")
+    page_metrics_report: str = Field("reports/page_metrics.json", description="Page metrics report path")
+    collect_locator_timing: bool = Field(False, description="Time every element action and report the slowest locators")
+    locator_timing_report: str = Field("reports/locator_timing.json", description="Locator timing report path")
+    locator_timing_top: int = Field(10, description="Number of slowest locators printed at the end of the session")
+
+    # Adaptive element timeouts learned from previous runs
+    adaptive_timeouts: bool = Field(False, description="Derive element timeouts from the p99 latency of their locator in previous runs")
+    adaptive_timeout_store: str = Field(".cache/locator_latency.json", description="Store of locator latency histograms")
+    adaptive_timeout_multiplier: float = Field(3.0, description="Multiple of the p99 latency used as the timeout")
+    adaptive_timeout_floor: int = Field(2000, description="Minimum adaptive timeout in milliseconds")
+    adaptive_timeout_ceiling: int = Field(10000, description="Maximum adaptive timeout in milliseconds")
+    adaptive_timeout_min_samples: int = Field(20, description="Samples a locator needs before its timeout is adapted")
+    adaptive_timeout_max_samples: int = Field(1000, description="Samples kept per locator, older samples are halved above it")
+
+    # Failure-only tracing
+    trace_on_failure: bool = Field(False, description="Record a Playwright trace chunk per test and keep it only for failed or slow tests")
+    trace_slow_threshold: float = Field(30.0, description="Test duration in seconds after which its trace is kept")
+    trace_dir: str = Field("reports/traces", description="Directory for kept traces")
+    trace_max_files: int = Field(50, description="Maximum number of kept traces, the oldest are removed first")
+
+    # HAR record/replay of backend responses for test classes marked with @pytest.mark.har
+    har_mode: Literal["off", "record", "replay"] = Field("off", description="HAR mode: off, record or replay")
+    har_dir: str = Field("resources/har", description="Directory with recorded HAR files")
+    har_url_filter: str = Field("**/api/**", description="Glob pattern of backend requests recorded to and replayed from HAR")
+
     # User credentials for testing
     admin_username: str = Field("admin", description="Admin username for testing")
     admin_password: str = Field("password", description="Admin password for testing")
@@ -19,6 +86,7 @@ class BaseConfig(BaseSettings):
     user_password: str = Field("userpass", description="Regular user password for testing")
     readonly_username: str = Field("readonly", description="Read-only user username for testing")
     readonly_password: str = Field("readonlypass", description="Read-only user password for testing")
+    auth_state_ttl: int = Field(1800, description="Lifetime of cached authentication state in seconds")
 
     # base ids
     depr_case_id: str = Field(description="Depreciation Case ID")
@@ -1,7 +1,39 @@
+import logging
+import os
+import time
+from collections import Counter
+from pathlib import Path
+
 import pytest
 from playwright.sync_api import sync_playwright
 
+from config import base_settings
 from framework.ui.driver import Driver
+from framework.ui.locator_timing import LocatorTimingRecorder, get_percentile
+
+network_stats_key = pytest.StashKey[list[dict]]()
+locator_timing_key = pytest.StashKey[list[dict]]()
+phase_report_key = pytest.StashKey[dict[str, pytest.TestReport]]()
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    report = yield
+    item.stash.setdefault(phase_report_key, {})[report.when] = report
+    return report
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    # Runs once in the pytest-xdist controller, before the workers share the asset cache
+    if not hasattr(session.config, "workerinput"):
+        try:
+            Driver.http_cache.prune()
+        except Exception as error:
+            # Stale builds only take disk space, they must not stop the session
+            logger.warning("Could not prune the HTTP cache: %s", error)
 
 
 @pytest.fixture(scope="session")
@@ -17,3 +49,116 @@ def launch_workspace(start_session):
     Driver.new_workspace()
     yield
     Driver.close_contexts()
+
+
+@pytest.fixture(autouse=True, scope="class")
+def reset_workspace(launch_workspace):
+    yield
+    if base_settings.context_pool_size:
+        Driver.reset_workspace()
+
+
+@pytest.fixture(autouse=True, scope="class")
+def har_workspace(request, reset_workspace):
+    """Run a test class marked with @pytest.mark.har("name") in a context backed by a HAR file
+
+    In replay mode the backend responses are served from the HAR file and unmatched requests
+    go to the network. The mode comes from HAR_MODE and can be overridden with mode="record".
+    """
+    marker = request.node.get_closest_marker("har")
+    mode = marker.kwargs.get("mode", base_settings.har_mode) if marker else "off"
+    if mode == "off":
+        yield
+        return
+
+    name = marker.args[0] if marker.args else request.node.name
+    har_path = Path(base_settings.har_dir) / f"{name}.har"
+    if mode == "replay" and not har_path.exists():
+        logger.warning("HAR file %s not found, running %s against the backend", har_path, request.node.nodeid)
+        yield
+        return
+
+    Driver.new_workspace(har_path=har_path, record_har=mode == "record")
+    yield
+    Driver.close_workspace()
+
+
+@pytest.fixture(autouse=True)
+def trace_chunk(request, launch_workspace):
+    """Record a trace chunk for the test and keep it only if the test failed or was slow"""
+    if not Driver.tracer.enabled:
+        yield
+        return
+
+    Driver.start_trace_chunk(request.node.nodeid)
+    started_at = time.monotonic()
+    yield
+    reports = request.node.stash.get(phase_report_key, {})
+    failed = any(report.failed for report in reports.values())
+    slow = time.monotonic() - started_at > base_settings.trace_slow_threshold
+    Driver.stop_trace_chunk(request.node.nodeid, keep=failed or slow or request.node.get_closest_marker("trace") is not None)
+
+
+def pytest_sessionfinish(session):
+    if not hasattr(session.config, "workeroutput"):
+        return
+    # pytest-xdist worker: hand the statistics over to the controller
+    if Driver.resource_blocker.enabled:
+        session.config.workeroutput["network_blocking"] = Driver.resource_blocker.get_stats()
+    if Driver.locator_timing.enabled:
+        session.config.workeroutput["locator_timing"] = Driver.locator_timing.get_stats()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    workeroutput = getattr(node, "workeroutput", {})
+    if workeroutput.get("network_blocking"):
+        node.config.stash.setdefault(network_stats_key, []).append(workeroutput["network_blocking"])
+    if workeroutput.get("locator_timing"):
+        node.config.stash.setdefault(locator_timing_key, []).append(workeroutput["locator_timing"])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    write_network_summary(terminalreporter, config)
+    write_locator_timing_summary(terminalreporter, config)
+
+
+def write_network_summary(terminalreporter, config):
+    if not Driver.resource_blocker.enabled:
+        return
+
+    stats_list = config.stash.get(network_stats_key, None) or [Driver.resource_blocker.get_stats()]
+    blocked_types = Counter()
+    blocked_hosts = Counter()
+    for stats in stats_list:
+        blocked_types.update(stats["by_type"])
+        blocked_hosts.update(stats["by_host"])
+    blocked_requests = sum(stats["blocked_requests"] for stats in stats_list)
+    blocked_bytes = sum(stats["blocked_bytes"] for stats in stats_list)
+
+    terminalreporter.write_sep("-", "network resource blocking")
+    terminalreporter.write_line(f"Blocked requests: {blocked_requests}, request bytes saved: {blocked_bytes}")
+    for resource_type, count in blocked_types.most_common():
+        terminalreporter.write_line(f"  {resource_type}: {count}")
+    terminalreporter.write_line("Top blocked hosts:")
+    for host, count in blocked_hosts.most_common(10):
+        terminalreporter.write_line(f"  {host}: {count}")
+
+
+def write_locator_timing_summary(terminalreporter, config):
+    if not base_settings.collect_locator_timing:
+        return
+
+    stats = LocatorTimingRecorder.merge(config.stash.get(locator_timing_key, None) or [Driver.locator_timing.get_stats()])
+    if not stats:
+        return
+
+    terminalreporter.write_sep("-", f"slowest locators (top {base_settings.locator_timing_top})")
+    for locator, item in LocatorTimingRecorder.get_slowest(stats, base_settings.locator_timing_top):
+        terminalreporter.write_line(
+            f"{item['total'] / 1000:.2f}s total, {item['count']} calls, {item['failures']} failed, "
+            f"p50 {get_percentile(item['buckets'], 50):.0f}ms, p99 {get_percentile(item['buckets'], 99):.0f}ms, "
+            f"max {item['max']:.0f}ms  {locator}"
+        )
+        for call_site, count in item["call_sites"].most_common(3):
+            terminalreporter.write_line(f"    {os.path.relpath(call_site)} ({count} calls)")
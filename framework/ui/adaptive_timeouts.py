@@ -0,0 +1,73 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from config import base_settings
+from framework.ui.auth_state import file_lock
+from framework.ui.locator_timing import BUCKETS, get_percentile
+
+
+class AdaptiveTimeouts:
+    """Element timeouts derived from latencies observed in previous runs
+
+    The latency histograms of every locator are accumulated across runs in a local JSON
+    store. An element without an explicit timeout gets a multiple of its p99 latency,
+    bounded by a floor and a ceiling, once its locator has enough samples. Older samples
+    are halved when a locator reaches the sample limit, so the store follows the app.
+    """
+
+    def __init__(self, enabled: bool | None = None, store_path: Path | None = None):
+        self.enabled = base_settings.adaptive_timeouts if enabled is None else enabled
+        self.store_path = store_path or Path(base_settings.adaptive_timeout_store)
+        self._timeouts: dict[str, int] | None = None
+
+    def _read_store(self) -> dict[str, list[int]]:
+        if not self.store_path.exists():
+            return {}
+        data = json.loads(self.store_path.read_text(encoding="utf-8"))
+        # Histograms collected with other bucket bounds can't be combined with the current ones
+        if data.get("buckets") != list(BUCKETS):
+            return {}
+        return data["locators"]
+
+    def _load(self) -> dict[str, int]:
+        timeouts = {}
+        for locator, buckets in self._read_store().items():
+            if sum(buckets) >= base_settings.adaptive_timeout_min_samples:
+                timeout = get_percentile(buckets, 99) * base_settings.adaptive_timeout_multiplier
+                timeouts[locator] = int(min(max(timeout, base_settings.adaptive_timeout_floor), base_settings.adaptive_timeout_ceiling))
+        return timeouts
+
+    def get(self, locator: str) -> int | None:
+        """Get the learned timeout of a locator in milliseconds
+
+        Returns:
+            The timeout, or None if adaptive timeouts are disabled or the locator has too few samples
+        """
+        if not self.enabled:
+            return None
+        if self._timeouts is None:
+            self._timeouts = self._load()
+        return self._timeouts.get(locator)
+
+    def update(self, stats: dict[str, dict[str, Any]]) -> None:
+        """Add the histograms of this session to the store
+
+        Args:
+            stats: Per-locator statistics of LocatorTimingRecorder
+        """
+        if not self.enabled or not stats:
+            return
+
+        with file_lock(self.store_path.with_suffix(".lock")):
+            locators = self._read_store()
+            for locator, item in stats.items():
+                buckets = [a + b for a, b in zip(locators.get(locator, [0] * len(item["buckets"])), item["buckets"], strict=True)]
+                if sum(buckets) > base_settings.adaptive_timeout_max_samples:
+                    buckets = [count // 2 for count in buckets]
+                locators[locator] = buckets
+
+            tmp_path = self.store_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({"buckets": BUCKETS, "locators": locators}), encoding="utf-8")
+            os.replace(tmp_path, self.store_path)
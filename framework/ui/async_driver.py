@@ -0,0 +1,124 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TypeVar
+
+from playwright.async_api import Browser, BrowserContext, BrowserType, Page, async_playwright
+
+from config import base_settings
+from framework.ui.auth_state import AuthStateCache
+from framework.ui.browser_pool import get_context_options, get_launch_options
+
+T = TypeVar("T")
+
+
+class AsyncDriver:
+    """asyncio counterpart of Driver
+
+    All pages share one browser context. The current page is stored in a context variable,
+    so every asyncio task (e.g. each coroutine passed to asyncio.gather) works with its own page
+    while elements keep resolving through AsyncDriver.get_driver().
+    """
+
+    browser: Browser | None = None
+    context: BrowserContext | None = None
+    auth_cache: AuthStateCache = AuthStateCache(Path(".auth"))
+    _current_page: ContextVar[Page | None] = ContextVar("current_page", default=None)
+
+    @classmethod
+    async def init_browser(cls, browser: BrowserType) -> None:
+        """Initialize browser instance"""
+        cls.browser = await browser.launch(**get_launch_options())
+
+    @classmethod
+    async def new_workspace(cls, role: str | None = None) -> None:
+        """Create the shared browser context and a page for the current task
+
+        Args:
+            role: Role name whose cached authentication state is loaded into the context, e.g. "ADMIN"
+        """
+        if cls.browser is None:
+            raise Exception("Browser not initialized. Call init_browser first.")
+
+        cls.context = await cls.browser.new_context(
+            storage_state=cls.auth_cache.load(role) if role else None,
+            **get_context_options(),
+        )
+        cls.context.set_default_timeout(base_settings.timeout)
+        await cls.new_page()
+
+    @classmethod
+    def get_driver(cls) -> Page:
+        """Get the page of the current task"""
+        page = cls._current_page.get()
+        if page is None:
+            raise ValueError("Driver is not initialized, call AsyncDriver.new_workspace first.")
+        return page
+
+    @classmethod
+    async def new_page(cls) -> Page:
+        """Create a new page in the shared context and select it for the current task"""
+        if cls.context is None:
+            raise ValueError("No context selected")
+
+        page = await cls.context.new_page()
+        cls._current_page.set(page)
+        return page
+
+    @classmethod
+    async def run_on_new_page(cls, action: Callable[[], Awaitable[T]]) -> T:
+        """Run an action on its own page and close the page afterwards
+
+        Meant to be used inside asyncio.gather, where every action runs in its own task:
+
+            await asyncio.gather(*(AsyncDriver.run_on_new_page(check) for check in checks))
+
+        Args:
+            action: Coroutine function that works with AsyncDriver.get_driver()
+
+        Returns:
+            The result of the action
+        """
+        page = await cls.new_page()
+        try:
+            return await action()
+        finally:
+            await page.close()
+
+    @classmethod
+    async def goto(cls, url: str) -> None:
+        """Navigate to the specified URL"""
+        await cls.get_driver().goto(url)
+
+    @classmethod
+    async def close_contexts(cls) -> None:
+        """Close the shared browser context"""
+        if cls.context:
+            await cls.context.close()
+            cls.context = None
+        cls._current_page.set(None)
+
+    @classmethod
+    async def close_browser(cls) -> None:
+        """Close the browser instance"""
+        if cls.browser:
+            await cls.browser.close()
+            cls.browser = None
+
+    @classmethod
+    @asynccontextmanager
+    async def session(cls, role: str | None = None) -> AsyncGenerator[None, None]:
+        """Start Playwright, the browser and the workspace for the duration of the block
+
+        Args:
+            role: Role name whose cached authentication state is loaded into the context
+        """
+        async with async_playwright() as pw:
+            await cls.init_browser(pw.chromium)
+            await cls.new_workspace(role)
+            try:
+                yield
+            finally:
+                await cls.close_contexts()
+                await cls.close_browser()
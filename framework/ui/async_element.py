@@ -0,0 +1,182 @@
+from typing import Any
+
+from playwright.async_api import Locator, Page, expect
+
+from framework.ui.async_driver import AsyncDriver
+from framework.ui.dom_wait import Condition, async_wait_for_condition
+from framework.ui.element import FILL_FIELDS_SCRIPT, BaseElement, By, timed_action
+from framework.ui.snapshot import SNAPSHOT_SCRIPT, ElementSnapshot
+
+
+class AsyncBaseElement(BaseElement):
+    """asyncio counterpart of BaseElement
+
+    Element definitions and locator resolution are shared with BaseElement, only the
+    actions are coroutines. Elements resolve against the page of the current asyncio task.
+    """
+
+    @staticmethod
+    def _get_root() -> Page:
+        """Page used to resolve elements without a parent"""
+        return AsyncDriver.get_driver()
+
+    async def _assert_condition(self, condition: Condition, expected: Any, timeout: int | None, description: str) -> None:
+        timeout = self._get_timeout(timeout)
+        if not await async_wait_for_condition(self._get_locator(), condition, expected, timeout):
+            raise AssertionError(f"{self._get_timing_key()} {description} within {timeout} ms")
+
+    @timed_action
+    async def hover(self, **kwargs):
+        await self._get_locator().hover(**kwargs)
+        return self
+
+    @timed_action
+    async def all(self) -> list[Locator]:
+        return await self._get_locator().all()
+
+    @timed_action
+    async def count(self) -> int:
+        """Get the number of elements matching this locator
+
+        Returns:
+            The count of matching elements
+        """
+        return await self._get_locator().count()
+
+    @timed_action
+    async def get_attribute(self, attribute_name: str) -> str:
+        """Get the value of an attribute from the element
+
+        Args:
+            attribute_name: Name of the attribute to retrieve
+
+        Returns:
+            The attribute value as a string, or empty string if not found
+        """
+        return await self._get_locator().get_attribute(attribute_name) or ""
+
+    @timed_action
+    async def get_class_list(self) -> list[str]:
+        """Get the list of CSS classes applied to the element
+
+        Returns:
+            List of CSS class names
+        """
+        class_attr = await self.get_attribute("class")
+        return class_attr.split() if class_attr else []
+
+    @timed_action
+    async def is_enabled(self) -> bool:
+        """Check if the element is enabled
+
+        Returns:
+            True if the element is enabled, False otherwise
+        """
+        locator = self._get_locator()
+        class_attr = await locator.get_attribute("class") or ""
+        return await locator.is_enabled() and "disabled" not in class_attr.split()
+
+    @timed_action
+    async def snapshot(self) -> ElementSnapshot:
+        """Read text, attributes, classes, visibility, enabled state and bounding box at once
+
+        Returns:
+            Immutable snapshot of the element, read in a single evaluation in the page
+        """
+        return ElementSnapshot.from_script(await self._get_locator().evaluate(SNAPSHOT_SCRIPT))
+
+    @timed_action
+    async def should_be_visible(self, should_visible: bool = True, timeout: int | None = None) -> "AsyncBaseElement":
+        condition: Condition = "visible" if should_visible else "hidden"
+        await self._assert_condition(condition, None, timeout, "is not visible" if should_visible else "is still visible")
+        return self
+
+    @timed_action
+    async def is_visible(self) -> bool:
+        return await self._get_locator().is_visible()
+
+    @timed_action
+    async def is_exists(self) -> bool:
+        return await self._get_locator().count() > 0
+
+    @timed_action
+    async def click(self, timeout: int | None = None, force: bool = False) -> "AsyncBaseElement":
+        await self._get_locator().click(timeout=self._get_timeout(timeout), force=force)
+        return self
+
+    @timed_action
+    async def fill(self, value: str, timeout: int | None = None) -> "AsyncBaseElement":
+        await self._get_locator().fill(value, timeout=self._get_timeout(timeout))
+        return self
+
+    @timed_action
+    async def fill_fields(self, fields: dict[str, str | int | float | bool], timeout: int | None = None) -> "AsyncBaseElement":
+        """Set several form controls inside the element in a single evaluation
+
+        Args:
+            fields: Values by the name attribute of the control, booleans for checkboxes
+            timeout: Maximum time in milliseconds to wait for the controls to be rendered and editable
+
+        Raises:
+            ValueError: If a control is not found or not editable inside the element
+        """
+        timeout = self._get_timeout(timeout)
+        missing = await self._get_locator().evaluate(FILL_FIELDS_SCRIPT, {"fields": fields, "timeout": timeout}, timeout=timeout)
+        if missing:
+            raise ValueError(f"Form controls not found or not editable: {', '.join(missing)}")
+        return self
+
+    @timed_action
+    async def press(self, key: str, timeout: int | None = None) -> "AsyncBaseElement":
+        await self._get_locator().press(key, timeout=self._get_timeout(timeout))
+        return self
+
+    @timed_action
+    async def check(self, timeout: int | None = None, force: bool = False) -> "AsyncBaseElement":
+        await self._get_locator().check(timeout=self._get_timeout(timeout), force=force)
+        return self
+
+    @timed_action
+    async def uncheck(self, timeout: int | None = None, force: bool = False) -> "AsyncBaseElement":
+        await self._get_locator().uncheck(timeout=self._get_timeout(timeout), force=force)
+        return self
+
+    @timed_action
+    async def get_text(self) -> str:
+        return await self._get_locator().text_content() or ""
+
+    @timed_action
+    async def should_have_text(self, text: str, exact: bool = False, timeout: int | None = None) -> "AsyncBaseElement":
+        await self._assert_condition("text", {"text": text, "exact": exact}, timeout, f"doesn't have text {text!r}")
+        return self
+
+    @timed_action
+    async def should_be_enabled(self, enabled: bool = True, timeout: int | None = None) -> "AsyncBaseElement":
+        await self._assert_condition("enabled", enabled, timeout, "is not enabled" if enabled else "is not disabled")
+        return self
+
+    @timed_action
+    async def should_be_disabled(self) -> "AsyncBaseElement":
+        return await self.should_be_enabled(enabled=False)
+
+    @timed_action
+    async def should_have_count(self, count: int) -> "AsyncBaseElement":
+        await expect(self._get_locator()).to_have_count(count)
+        return self
+
+    @timed_action
+    async def wait_for_stable(self, idle: int = 100, timeout: int | None = None) -> "AsyncBaseElement":
+        """Wait until nothing changes inside the element for idle milliseconds"""
+        await self._assert_condition("idle", idle, timeout, f"didn't settle for {idle} ms")
+        return self
+
+    @timed_action
+    async def wait_for(self, timeout: int | None = None) -> "AsyncBaseElement":
+        await self._get_locator().wait_for(timeout=self._get_timeout(timeout))
+        return self
+
+    def get_child_locator(self, locator: str) -> "AsyncBaseElement":
+        return self.chain(AsyncBaseElement(By.LOCATOR, locator))
+
+
+AsyncElement = AsyncBaseElement
@@ -0,0 +1,89 @@
+from collections.abc import AsyncIterator, Callable
+from types import MappingProxyType
+from typing import TypeVar
+
+from playwright.async_api import Locator
+
+from framework.ui.async_element import AsyncBaseElement
+from framework.ui.element import BaseElement, timed_action
+from framework.ui.predicates import MATCH_SCRIPT, Predicate
+from framework.ui.snapshot import ITEMS_SCRIPT, SNAPSHOT_ALL_SCRIPT, ElementSnapshot, ItemSnapshot
+
+T = TypeVar("T")
+
+
+class AsyncListElement[T](AsyncBaseElement):
+    """asyncio counterpart of ListElement with async iteration support"""
+
+    def __init__(
+        self,
+        search_by: str,
+        locator: str,
+        item_factory: Callable[[Locator, int], T],
+        parent: BaseElement | Locator | None = None,
+        ignore_parent: bool = False,
+    ):
+        super().__init__(search_by, locator, parent, ignore_parent)
+        self.item_factory = item_factory
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        # Counted in the same evaluation that reads the items, their locators are created lazily
+        for item in await self.materialize():
+            yield self.item_factory(item.locator, item.index)
+
+    def __getitem__(self, index: int) -> T:
+        return self.item_factory(self._get_locator().nth(index), index)
+
+    @timed_action
+    async def count(self) -> int:
+        return await self._get_locator().count()
+
+    @timed_action
+    async def snapshot(self) -> list[ElementSnapshot]:
+        """Read the state of all matching elements in a single evaluation
+
+        Returns:
+            Immutable snapshots of the elements in document order
+        """
+        return [ElementSnapshot.from_script(data) for data in await self._get_locator().evaluate_all(SNAPSHOT_ALL_SCRIPT)]
+
+    @timed_action
+    async def materialize(self) -> list[ItemSnapshot]:
+        """Read text and attributes of all items in a single evaluation
+
+        Returns:
+            Item snapshots in document order, their locators are created only when used
+        """
+        locator = self._get_locator()
+        items = await locator.evaluate_all(ITEMS_SCRIPT)
+        return [ItemSnapshot(index, item["text"], MappingProxyType(item["attributes"]), locator) for index, item in enumerate(items)]
+
+    @timed_action
+    async def query(self, predicate: Predicate, first: bool = False) -> list[ItemSnapshot]:
+        """Find the items matching the predicate in the page, only the matches are returned
+
+        Args:
+            predicate: Condition built with framework.ui.predicates
+            first: Stop at the first match
+        """
+        locator = self._get_locator()
+        items = await locator.evaluate_all(MATCH_SCRIPT, {"predicate": predicate.spec, "first": first})
+        return [ItemSnapshot(item["index"], item["text"], MappingProxyType(item["attributes"]), locator) for item in items]
+
+    async def filter(self, predicate: Callable[[ItemSnapshot], bool] | Predicate) -> list[T]:
+        """Get the items matching the predicate
+
+        A Predicate is evaluated in the page. A callable gets the snapshot of every item, all
+        items are read in a single evaluation.
+        """
+        if isinstance(predicate, Predicate):
+            return [self.item_factory(item.locator, item.index) for item in await self.query(predicate)]
+        return [self.item_factory(item.locator, item.index) for item in await self.materialize() if predicate(item)]
+
+    async def find(self, predicate: Callable[[ItemSnapshot], bool] | Predicate) -> T | None:
+        """Get the first item matching the predicate, see filter"""
+        if isinstance(predicate, Predicate):
+            item = next(iter(await self.query(predicate, first=True)), None)
+        else:
+            item = next((item for item in await self.materialize() if predicate(item)), None)
+        return None if item is None else self.item_factory(item.locator, item.index)
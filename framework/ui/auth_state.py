@@ -0,0 +1,118 @@
+import json
+import os
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from config import base_settings
+
+
+@contextmanager
+def file_lock(lock_path: Path, timeout: float = 60, poll_interval: float = 0.1) -> Generator[None, None, None]:
+    """Cross-process lock based on exclusive creation of a lock file
+
+    A lock file older than the timeout is treated as left over by a crashed process and removed.
+
+    Args:
+        lock_path: Path of the lock file
+        timeout: Maximum time to wait for the lock in seconds
+        poll_interval: Delay between attempts in seconds
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > timeout:
+                    lock_path.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Could not acquire lock {lock_path} within {timeout} seconds") from None
+            time.sleep(poll_interval)
+
+    try:
+        yield
+    finally:
+        os.close(fd)
+        lock_path.unlink(missing_ok=True)
+
+
+class AuthStateCache:
+    """Storage state cache keyed by user role
+
+    States are kept in memory after the first load and stored as ``<role>.json`` files
+    so that parallel workers can reuse a login done by another worker. A state is
+    considered expired when it is older than the TTL or one of its cookies has expired.
+    """
+
+    def __init__(self, directory: Path, ttl: int | None = None):
+        self.directory = directory
+        self.ttl = base_settings.auth_state_ttl if ttl is None else ttl
+        self._states: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    def _state_path(self, role: str) -> Path:
+        return self.directory / f"{role.lower()}.json"
+
+    def _is_valid(self, saved_at: float, state: dict[str, Any]) -> bool:
+        now = time.time()
+        if now - saved_at > self.ttl:
+            return False
+        return all(cookie.get("expires", -1) <= 0 or cookie["expires"] > now for cookie in state.get("cookies", []))
+
+    @contextmanager
+    def lock(self, role: str) -> Generator[None, None, None]:
+        """Hold the cross-process lock for a role while its state is being produced"""
+        with file_lock(self.directory / f"{role.lower()}.lock"):
+            yield
+
+    def load(self, role: str) -> dict[str, Any] | None:
+        """Get a valid storage state for the role
+
+        Args:
+            role: User role name, e.g. "ADMIN"
+
+        Returns:
+            Storage state dict, or None if there is no valid state
+        """
+        if role in self._states:
+            saved_at, state = self._states[role]
+            if self._is_valid(saved_at, state):
+                return state
+            del self._states[role]
+
+        path = self._state_path(role)
+        try:
+            saved_at = path.stat().st_mtime
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if not self._is_valid(saved_at, state):
+            return None
+        self._states[role] = (saved_at, state)
+        return state
+
+    def save(self, role: str, state: dict[str, Any]) -> None:
+        """Store the storage state for the role
+
+        The file is written to a temporary path and moved into place, so readers
+        in other workers never see a partially written state.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._state_path(role)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, path)
+        self._states[role] = (time.time(), state)
+
+    def invalidate(self, role: str) -> None:
+        """Drop the cached state for the role"""
+        self._states.pop(role, None)
+        self._state_path(role).unlink(missing_ok=True)
@@ -0,0 +1,216 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from playwright.sync_api import Browser, BrowserContext, BrowserType, ViewportSize
+
+from config import base_settings
+from framework.ui.browser_server import BrowserServer
+
+# Replaces the localStorage of the current origin with the items of a storage state
+SEED_LOCAL_STORAGE_SCRIPT = """
+(items) => {
+    window.localStorage.clear();
+    for (const { name, value } of items) window.localStorage.setItem(name, value);
+}
+"""
+# Path served with an empty document to get a page on an origin without loading the app
+STORAGE_SEED_PATH = "/__storage_state__"
+
+
+def get_worker_id() -> str:
+    """Return the pytest-xdist worker id ("gw0", "gw1", ...) or "master" outside of xdist"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def get_app_origin() -> str:
+    """Return the origin of the application under test"""
+    return f"{base_settings.protocol}://{base_settings.host}"
+
+
+def get_launch_options() -> dict[str, Any]:
+    """Return the options used to launch the browser"""
+    return {
+        "channel": "chrome",
+        "headless": base_settings.headless_mode,
+        "slow_mo": 300 if base_settings.demo_test else None,
+        "args": ("--start-maximized", "--lang=en-US"),
+    }
+
+
+def get_context_options() -> dict[str, Any]:
+    """Return the options used for every new browser context"""
+    return {
+        "ignore_https_errors": True,
+        "locale": "en-US",
+        "viewport": ViewportSize(width=1920, height=1080),
+        "timezone_id": "America/New_York",
+    }
+
+
+def apply_storage_state(context: BrowserContext, storage_state: dict[str, Any] | Path | None) -> None:
+    """Apply cookies and localStorage of a storage state to an existing context
+
+    The cookies and the localStorage of the app origin and of every origin in the state are
+    replaced, so switching roles doesn't keep the session or items of the previous role.
+
+    Args:
+        context: Browser context to update
+        storage_state: Storage state dict or path to a storage state JSON file
+    """
+    if storage_state is None:
+        return
+    if isinstance(storage_state, Path):
+        storage_state = json.loads(storage_state.read_text(encoding="utf-8"))
+
+    context.clear_cookies()
+    if storage_state.get("cookies"):
+        context.add_cookies(storage_state["cookies"])
+
+    # Origins with empty localStorage are left out of a storage state, the app origin is cleared anyway
+    items_by_origin = {get_app_origin(): []} | {origin["origin"]: origin["localStorage"] for origin in storage_state.get("origins", [])}
+    # localStorage is written directly in a temporary page, the pages in use keep their URLs
+    page = context.new_page()
+    try:
+        for origin, items in items_by_origin.items():
+            url = f"{origin}{STORAGE_SEED_PATH}"
+            page.route(url, lambda route: route.fulfill(content_type="text/html", body="<html></html>"))
+            page.goto(url)
+            page.evaluate(SEED_LOCAL_STORAGE_SCRIPT, items)
+    finally:
+        page.close()
+
+
+class BrowserPool:
+    """Per-worker browser with a pool of recycled contexts
+
+    Every pytest-xdist worker is a separate process, so each one owns its own pool,
+    its own warm browser and its own limit of open contexts. Released contexts are
+    reset and handed out again instead of being closed and recreated.
+    """
+
+    def __init__(
+        self,
+        browser_type: BrowserType,
+        max_contexts: int | None = None,
+        warm_size: int | None = None,
+        worker_id: str | None = None,
+    ):
+        self.browser_type = browser_type
+        self.max_contexts = max_contexts or base_settings.max_contexts_per_worker
+        self.warm_size = min(base_settings.context_pool_size if warm_size is None else warm_size, self.max_contexts)
+        self.worker_id = worker_id or get_worker_id()
+        self.browser: Browser | None = None
+        self.idle: list[BrowserContext] = []
+        self.in_use: list[BrowserContext] = []
+
+    def launch(self) -> Browser:
+        """Launch the browser for the current worker or connect to the reusable browser server"""
+        if self.browser is None and base_settings.reuse_browser:
+            endpoint = BrowserServer.get_endpoint(self.browser_type, get_launch_options())
+            self.browser = self.browser_type.connect_over_cdp(endpoint, slow_mo=get_launch_options()["slow_mo"])
+        elif self.browser is None:
+            self.browser = self.browser_type.launch(**get_launch_options())
+        return self.browser
+
+    @property
+    def size(self) -> int:
+        """Number of contexts currently owned by the pool"""
+        return len(self.idle) + len(self.in_use)
+
+    def _create_context(self, **context_options: Any) -> BrowserContext:
+        if self.browser is None:
+            raise Exception("Browser not initialized. Call launch first.")
+
+        context = self.browser.new_context(**context_options)
+        context.set_default_timeout(base_settings.timeout)
+        context.new_page()
+        return context
+
+    def prewarm(self, **context_options: Any) -> None:
+        """Fill the idle queue up to the configured warm size
+
+        Args:
+            **context_options: Options passed to Browser.new_context
+        """
+        while len(self.idle) < self.warm_size and self.size < self.max_contexts:
+            self.idle.append(self._create_context(**context_options))
+
+    def acquire(self, fresh: bool = False, **context_options: Any) -> BrowserContext:
+        """Get a warm context or create a new one within the worker limit
+
+        Args:
+            fresh: Always create a new context, e.g. when it gets routes that must not be recycled;
+                an idle context is closed for it when the worker is at its limit
+            **context_options: Options passed to Browser.new_context for new contexts
+
+        Returns:
+            Browser context with at least one open page reserved for the caller
+        """
+        if self.idle and not fresh:
+            context = self.idle.pop(0)
+        elif self.size < self.max_contexts or self.idle:
+            if self.size >= self.max_contexts:
+                # Warm contexts are cheap to recreate, one makes room for the fresh context
+                self.idle.pop(0).close()
+            context = self._create_context(**context_options)
+        else:
+            raise RuntimeError(f"Worker '{self.worker_id}' reached the limit of {self.max_contexts} browser contexts")
+
+        self.in_use.append(context)
+        return context
+
+    def reset(self, context: BrowserContext, storage_state: dict[str, Any] | Path | None = None) -> None:
+        """Bring a context back to a clean state without recreating it
+
+        Extra pages are closed, cookies and application storage are cleared and the
+        first page is moved to about:blank. The storage state, if given, is applied again.
+
+        Args:
+            context: Browser context to reset
+            storage_state: Storage state to seed the context with after the reset
+        """
+        pages = context.pages
+        for page in pages[1:]:
+            page.close()
+        page = pages[0] if pages else context.new_page()
+
+        context.clear_cookies()
+        context.clear_permissions()
+        cdp_session = context.new_cdp_session(page)
+        cdp_session.send("Storage.clearDataForOrigin", {"origin": get_app_origin(), "storageTypes": "all"})
+        cdp_session.detach()
+        page.goto("about:blank")
+
+        apply_storage_state(context, storage_state)
+
+    def release(self, context: BrowserContext, storage_state: dict[str, Any] | Path | None = None) -> None:
+        """Reset a context and return it to the idle queue
+
+        Args:
+            context: Browser context to release
+            storage_state: Storage state to seed the context with after the reset
+        """
+        if context in self.in_use:
+            self.in_use.remove(context)
+
+        self.reset(context, storage_state)
+        self.idle.append(context)
+
+    def discard(self, context: BrowserContext) -> None:
+        """Close a context instead of returning it to the pool"""
+        if context in self.in_use:
+            self.in_use.remove(context)
+        context.close()
+
+    def close(self) -> None:
+        """Close all contexts and the browser, a reusable browser server is only disconnected from"""
+        for context in self.idle + self.in_use:
+            context.close()
+        self.idle = []
+        self.in_use = []
+
+        if self.browser:
+            self.browser.close()
+            self.browser = None
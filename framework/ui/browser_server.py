@@ -0,0 +1,152 @@
+import contextlib
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import requests
+from playwright.sync_api import BrowserType, Error, sync_playwright
+
+from config import base_settings
+from framework.ui.auth_state import file_lock
+
+# Install locations of the Google Chrome stable channel, as Playwright resolves channel="chrome"
+CHROME_EXECUTABLES = {
+    "linux": ["/opt/google/chrome/chrome"],
+    "darwin": ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"],
+    "win32": [
+        os.path.join(os.environ.get(variable, ""), "Google", "Chrome", "Application", "chrome.exe")
+        for variable in ("LOCALAPPDATA", "PROGRAMFILES", "PROGRAMFILES(X86)")
+    ],
+}
+
+
+class BrowserServer:
+    """Local browser that keeps running between pytest invocations
+
+    The browser is started detached with a remote debugging port, and its endpoint is stored
+    in a state file. Later sessions connect to it over CDP instead of launching a new browser,
+    so local re-runs skip the browser cold start. Closing the connected Browser only closes
+    the contexts of the session, the browser itself keeps running until stop() is called.
+    """
+
+    state_path: Path = Path(".browser_server.json")
+
+    @classmethod
+    def _read_state(cls) -> dict | None:
+        try:
+            return json.loads(cls.state_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def is_alive(endpoint: str) -> bool:
+        """Check if a browser answers on the remote debugging endpoint"""
+        try:
+            return requests.get(f"{endpoint}/json/version", timeout=1).ok
+        except requests.RequestException:
+            return False
+
+    @staticmethod
+    def get_executable_path(browser_type: BrowserType, channel: str | None) -> str:
+        """Resolve the executable of the browser the regular launch would use
+
+        Args:
+            browser_type: Browser type providing the bundled executable
+            channel: Browser channel of the launch options, only "chrome" is resolved
+
+        Returns:
+            BROWSER_EXECUTABLE_PATH if set, else the channel or bundled browser executable
+        """
+        if base_settings.browser_executable_path:
+            return base_settings.browser_executable_path
+        if channel is None:
+            return browser_type.executable_path
+        if channel == "chrome":
+            for path in CHROME_EXECUTABLES.get(sys.platform, []):
+                if Path(path).exists():
+                    return path
+        raise RuntimeError(f"Browser channel '{channel}' not found, set BROWSER_EXECUTABLE_PATH")
+
+    @classmethod
+    def start(cls, browser_type: BrowserType, launch_options: dict[str, Any], timeout: float = 30) -> str:
+        """Start a detached browser with a remote debugging port
+
+        Args:
+            browser_type: Browser type providing the default executable
+            launch_options: Options of the regular launch, the same channel, args and headless mode are used
+            timeout: Maximum time to wait for the browser to start in seconds
+
+        Returns:
+            The remote debugging endpoint
+        """
+        port = base_settings.browser_server_port
+        endpoint = f"http://127.0.0.1:{port}"
+        args = [
+            cls.get_executable_path(browser_type, launch_options.get("channel")),
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={Path(tempfile.gettempdir()) / f'pw-browser-server-{port}'}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            *launch_options.get("args", ()),
+        ]
+        if launch_options.get("headless", True):
+            args.append("--headless=new")
+
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+        deadline = time.monotonic() + timeout
+        while not cls.is_alive(endpoint):
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError(f"Browser server did not start on {endpoint}")
+            time.sleep(0.2)
+
+        cls.state_path.write_text(json.dumps({"pid": process.pid, "endpoint": endpoint}), encoding="utf-8")
+        return endpoint
+
+    @classmethod
+    def get_endpoint(cls, browser_type: BrowserType, launch_options: dict[str, Any]) -> str:
+        """Return the endpoint of the running browser, starting it if needed
+
+        Parallel workers wait on a lock file, so only one of them starts the browser.
+        """
+        with file_lock(cls.state_path.with_suffix(".lock")):
+            state = cls._read_state()
+            if state and cls.is_alive(state["endpoint"]):
+                return state["endpoint"]
+            return cls.start(browser_type, launch_options)
+
+    @classmethod
+    def stop(cls) -> None:
+        """Stop the running browser
+
+        The browser is asked to close over its debugging endpoint. Its process is only killed
+        when the endpoint still answers afterwards, so a recycled pid is never signalled.
+        """
+        state = cls._read_state()
+        if state and cls.is_alive(state["endpoint"]):
+            with sync_playwright() as playwright, contextlib.suppress(Error):
+                browser = playwright.chromium.connect_over_cdp(state["endpoint"])
+                browser.new_browser_cdp_session().send("Browser.close")
+            if cls.is_alive(state["endpoint"]):
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(state["pid"], signal.SIGTERM)
+        cls.state_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["stop"]:
+        BrowserServer.stop()
+    else:
+        print("Usage: python -m framework.ui.browser_server stop")
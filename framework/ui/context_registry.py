@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from itertools import count
+
+from playwright.sync_api import BrowserContext, Error, Page
+
+from config import base_settings
+
+
+@dataclass
+class ContextEntry:
+    """Browser context registered in the driver with its pages"""
+
+    name: str
+    context: BrowserContext
+    pages: list[Page] = field(default_factory=list)
+    selected_page: int = 1
+    recyclable: bool = True
+
+    @property
+    def page(self) -> Page:
+        """The selected page"""
+        return self.pages[self.selected_page - 1]
+
+
+class ContextRegistry:
+    """Bounded registry of browser contexts ordered from least to most recently used
+
+    Lookup by name is O(1) and marks the context as used. When the registry is full,
+    the least recently used context other than the current one is evicted, and when
+    a context reaches its page limit, its oldest page is closed. With a heap limit, contexts
+    whose pages use more JS heap than the limit are evicted as well, measured over CDP
+    whenever room is reserved for a new context.
+    """
+
+    def __init__(self, max_contexts: int | None = None, max_pages: int | None = None, max_heap_mb: int | None = None):
+        self.max_contexts = max_contexts or base_settings.max_contexts_per_worker
+        self.max_pages = max_pages or base_settings.max_pages_per_context
+        self.max_heap_bytes = (base_settings.max_context_heap_mb if max_heap_mb is None else max_heap_mb) * 1024 * 1024
+        self._entries: OrderedDict[str, ContextEntry] = OrderedDict()
+        self._names = count(1)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ContextEntry]:
+        return iter(list(self._entries.values()))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def get(self, name: str) -> ContextEntry:
+        """Get a context by name and mark it as most recently used"""
+        entry = self._entries[name]
+        self._entries.move_to_end(name)
+        return entry
+
+    def last(self) -> ContextEntry | None:
+        """The most recently used context"""
+        return next(reversed(self._entries.values()), None)
+
+    def reserve(self, keep: str | None = None) -> list[ContextEntry]:
+        """Unregister contexts above the heap limit and least recently used ones until there is room for a new one
+
+        Args:
+            keep: Name of a context that must not be evicted, usually the current one
+
+        Returns:
+            Evicted entries, the caller is responsible for releasing their contexts
+        """
+        evicted = []
+        if self.max_heap_bytes:
+            for name, entry in list(self._entries.items()):
+                if name != keep and self.get_heap_usage(entry) > self.max_heap_bytes:
+                    evicted.append(self._entries.pop(name))
+        for name in list(self._entries):
+            if len(self._entries) < self.max_contexts:
+                break
+            if name != keep:
+                evicted.append(self._entries.pop(name))
+        return evicted
+
+    @staticmethod
+    def get_heap_usage(entry: ContextEntry) -> int:
+        """Used JS heap of the open pages of a context in bytes"""
+        used = 0
+        for page in entry.pages:
+            if page.is_closed():
+                continue
+            try:
+                cdp_session = entry.context.new_cdp_session(page)
+                used += cdp_session.send("Runtime.getHeapUsage")["usedSize"]
+                cdp_session.detach()
+            except Error:
+                # A page that is navigating or crashed has no heap to measure
+                continue
+        return used
+
+    def add(self, context: BrowserContext, recyclable: bool = True) -> ContextEntry:
+        """Register a context with its first page under a new unique name"""
+        entry = ContextEntry(name=f"context_{next(self._names)}", context=context, pages=context.pages[:1], recyclable=recyclable)
+        self._entries[entry.name] = entry
+        return entry
+
+    def remove(self, name: str) -> ContextEntry:
+        """Unregister a context"""
+        return self._entries.pop(name)
+
+    def add_page(self, entry: ContextEntry, page: Page) -> None:
+        """Add a page to a context and select it, closing the oldest page above the page limit"""
+        entry.pages.append(page)
+        while len(entry.pages) > self.max_pages:
+            entry.pages.pop(0).close()
+        entry.selected_page = len(entry.pages)
+
+    def clear(self) -> list[ContextEntry]:
+        """Unregister all contexts
+
+        Returns:
+            Removed entries, the caller is responsible for releasing their contexts
+        """
+        entries = list(self._entries.values())
+        self._entries.clear()
+        return entries
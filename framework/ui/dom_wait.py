@@ -0,0 +1,134 @@
+import time
+from typing import Any, Literal
+
+from playwright.async_api import Locator as AsyncLocator
+from playwright.sync_api import Error, Locator
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+Condition = Literal["visible", "hidden", "text", "enabled", "idle"]
+
+# Resolves once the condition holds for the elements, re-checking it on every DOM mutation
+# and finished transition instead of polling. Resolves with "detached" when an element is
+# replaced, so the caller resolves the locator again, and with "timeout" when time is up.
+WAIT_FOR_CONDITION_SCRIPT = """
+(elements, { condition, expected, timeout }) => new Promise((resolve) => {
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && window.getComputedStyle(el).visibility !== "hidden";
+    };
+    const isDisabled = (el) => (["BUTTON", "INPUT", "SELECT", "TEXTAREA", "OPTION", "OPTGROUP"].includes(el.tagName)
+        && (el.disabled || !!el.closest("fieldset[disabled]"))) || !!el.closest("[aria-disabled='true']");
+    const normalize = (text) => text.replace(/\\s+/g, " ").trim();
+    const conditions = {
+        visible: ([el]) => isVisible(el),
+        hidden: (els) => els.every((el) => !isVisible(el)),
+        text: ([el]) => {
+            const text = normalize(el.textContent ?? "");
+            return expected.exact ? text === normalize(expected.text) : text.includes(normalize(expected.text));
+        },
+        enabled: ([el]) => !isDisabled(el) === expected,
+        idle: () => false,
+    };
+    const check = () => {
+        if (elements.some((el) => !el.isConnected)) return "detached";
+        return conditions[condition](elements) ? "done" : null;
+    };
+
+    let idleTimer = null;
+    const finish = (result) => {
+        observer.disconnect();
+        document.removeEventListener("transitionend", onChange, true);
+        document.removeEventListener("animationend", onChange, true);
+        clearTimeout(timer);
+        clearTimeout(idleTimer);
+        resolve(result);
+    };
+    const onChange = () => {
+        if (condition === "idle") {
+            // Done once the elements had no mutations for the expected number of milliseconds
+            clearTimeout(idleTimer);
+            idleTimer = setTimeout(() => finish("done"), expected);
+            return;
+        }
+        const result = check();
+        if (result) finish(result);
+    };
+    const observer = new MutationObserver(onChange);
+    const timer = setTimeout(() => finish("timeout"), timeout);
+    const initial = condition === "idle" ? null : check();
+    if (initial) {
+        finish(initial);
+        return;
+    }
+    const targets = condition === "idle" ? elements : [document];
+    targets.forEach((target) => observer.observe(target, { subtree: true, childList: true, attributes: true, characterData: true }));
+    document.addEventListener("transitionend", onChange, true);
+    document.addEventListener("animationend", onChange, true);
+    if (condition === "idle") onChange();
+})
+"""
+
+SINGLE_ELEMENT_SCRIPT = f"(el, arg) => ({WAIT_FOR_CONDITION_SCRIPT.strip()})([el], arg)"
+
+
+def _should_retry(error: Error) -> bool:
+    # A navigation destroys the execution context of the wait, the locator is resolved again
+    return "context was destroyed" in str(error)
+
+
+def _get_script(condition: Condition) -> tuple[str, bool]:
+    # Hidden also holds when nothing matches, so it checks all matches without waiting for one
+    return (WAIT_FOR_CONDITION_SCRIPT, True) if condition == "hidden" else (SINGLE_ELEMENT_SCRIPT, False)
+
+
+def wait_for_condition(locator: Locator, condition: Condition, expected: Any = None, timeout: float = 10000) -> bool:
+    """Wait for a DOM condition of the element with one in-page wait instead of polling
+
+    Args:
+        locator: Element to wait on
+        condition: "visible", "hidden", "text" ({"text", "exact"}), "enabled" (bool) or
+            "idle" (milliseconds without mutations inside the element)
+        expected: Expected value of the condition
+        timeout: Maximum time in milliseconds
+
+    Returns:
+        True if the condition was met within the timeout
+    """
+    script, all_elements = _get_script(condition)
+    deadline = time.monotonic() + timeout / 1000
+    while (remaining := (deadline - time.monotonic()) * 1000) > 0:
+        arg = {"condition": condition, "expected": expected, "timeout": remaining}
+        try:
+            result = locator.evaluate_all(script, arg) if all_elements else locator.evaluate(script, arg, timeout=remaining)
+        except PlaywrightTimeoutError:
+            # The element didn't appear in time
+            return False
+        except Error as error:
+            if not _should_retry(error):
+                raise
+            continue
+        if result != "detached":
+            return result == "done"
+    return False
+
+
+async def async_wait_for_condition(locator: AsyncLocator, condition: Condition, expected: Any = None, timeout: float = 10000) -> bool:
+    """asyncio counterpart of wait_for_condition"""
+    script, all_elements = _get_script(condition)
+    deadline = time.monotonic() + timeout / 1000
+    while (remaining := (deadline - time.monotonic()) * 1000) > 0:
+        arg = {"condition": condition, "expected": expected, "timeout": remaining}
+        try:
+            if all_elements:
+                result = await locator.evaluate_all(script, arg)
+            else:
+                result = await locator.evaluate(script, arg, timeout=remaining)
+        except PlaywrightTimeoutError:
+            return False
+        except Error as error:
+            if not _should_retry(error):
+                raise
+            continue
+        if result != "detached":
+            return result == "done"
+    return False
@@ -1,103 +1,263 @@
+import time
 from pathlib import Path
-from typing import Any
+from urllib.parse import urlparse
 
-from playwright.sync_api import Browser, BrowserContext, BrowserType, Page, ViewportSize
+from playwright.sync_api import Browser, BrowserType, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from config import base_settings
+from framework.ui.adaptive_timeouts import AdaptiveTimeouts
+from framework.ui.auth_state import AuthStateCache
+from framework.ui.browser_pool import BrowserPool, apply_storage_state, get_context_options
+from framework.ui.context_registry import ContextEntry, ContextRegistry
+from framework.ui.http_cache import HttpCache
+from framework.ui.locator_timing import LocatorTimingRecorder
+from framework.ui.navigation_timing import NavigationTimingRecorder
+from framework.ui.network import ResourceBlocker
+from framework.ui.page_metrics import PageMetricsRecorder
+from framework.ui.readiness import STALE_ATTRIBUTE, ReadinessRegistry, ReadinessStrategy
+from framework.ui.tracing import TraceRecorder
+
+# Client-side navigation understood by history based routers such as React Router. Resolves
+# with true once the router replaced the elements of the previous page, and with false when
+# it redirected elsewhere or didn't respond in time.
+CLIENT_SIDE_NAVIGATE_SCRIPT = """
+({ path, staleSelector, timeout }) => new Promise((resolve) => {
+    const expected = new URL(path, window.location.href);
+    const check = () => {
+        if (window.location.pathname !== expected.pathname || window.location.search !== expected.search) return false;
+        return document.querySelector(staleSelector) ? null : true;
+    };
+    const finish = (result) => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(result);
+    };
+    const observer = new MutationObserver(() => {
+        const result = check();
+        if (result !== null) finish(result);
+    });
+    const timer = setTimeout(() => finish(false), timeout);
+    window.history.pushState({}, "", path);
+    window.dispatchEvent(new PopStateEvent("popstate", { state: {} }));
+    const result = check();
+    if (result !== null) {
+        finish(result);
+        return;
+    }
+    observer.observe(document, { subtree: true, childList: true });
+})
+"""
 
 
 class Driver:
+    pool: BrowserPool | None = None
     browser: Browser | None = None
-    contexts: dict[str, dict[str, Any]] = {}
+    contexts: ContextRegistry = ContextRegistry()
     current_context: str | None = None
-    auth_state_path: Path = Path(".auth/auth_state.json")
+    auth_cache: AuthStateCache = AuthStateCache(Path(".auth"))
+    http_cache: HttpCache = HttpCache()
+    resource_blocker: ResourceBlocker = ResourceBlocker()
+    navigation_timing: NavigationTimingRecorder = NavigationTimingRecorder()
+    tracer: TraceRecorder = TraceRecorder()
+    page_metrics: PageMetricsRecorder = PageMetricsRecorder()
+    locator_timing: LocatorTimingRecorder = LocatorTimingRecorder()
+    adaptive_timeouts: AdaptiveTimeouts = AdaptiveTimeouts()
+    readiness: ReadinessRegistry = ReadinessRegistry()
 
     @classmethod
     def init_browser(cls, browser: BrowserType) -> None:
-        """Initialize browser instance"""
-        cls.browser = browser.launch(
-            channel="chrome",
-            headless=base_settings.headless_mode,
-            slow_mo=300 if base_settings.demo_test else None,
-            args=("--start-maximized", "--lang=en-US"),
-        )
+        """Initialize browser instance for the current worker and pre-warm its contexts"""
+        cls.pool = BrowserPool(browser)
+        cls.browser = cls.pool.launch()
+        cls.pool.prewarm(**get_context_options())
 
     @classmethod
-    def new_workspace(cls) -> None:
-        """Create a new browser context and page"""
-        if cls.browser:
-            new_context = cls.browser.new_context(
-                ignore_https_errors=True,
-                locale="en-US",
-                viewport=ViewportSize(width=1920, height=1080),
-                timezone_id="America/New_York",
-                storage_state=cls.auth_state_path if cls.auth_state_path.exists() else None,
-            )
-            new_context.set_default_timeout(base_settings.timeout)
-
-            # Create new context name by incrementing the last one (1-9) or use default
-            new_context_name = f"context_{int(tuple(cls.contexts.keys())[-1][-1]) + 1}" if cls.contexts else "context_1"
-
-            page = new_context.new_page()
-            cls.contexts[new_context_name] = {
-                "context": new_context,
-                "pages": [page],
-                "selected_page": 1,
-            }
-            cls.current_context = new_context_name
+    def new_workspace(cls, har_path: Path | None = None, record_har: bool = False) -> None:
+        """Take a warm browser context from the pool and select its page
+
+        Args:
+            har_path: HAR file to replay backend responses from; a dedicated context is created for it
+            record_har: Record backend responses to har_path instead of replaying them
+        """
+        if cls.pool and cls.browser:
+            for evicted in cls.contexts.reserve(keep=cls.current_context):
+                cls._release_entry(evicted)
+
+            new_context = cls.pool.acquire(fresh=har_path is not None, **get_context_options())
+            # Routes registered later are matched first: HAR, then blocking, then the asset cache
+            cls.http_cache.install(new_context)
+            cls.resource_blocker.install(new_context)
+            cls.navigation_timing.install(new_context)
+            cls.tracer.install(new_context)
+            if har_path is not None:
+                if record_har:
+                    har_path.parent.mkdir(parents=True, exist_ok=True)
+                new_context.route_from_har(
+                    har_path,
+                    url=base_settings.har_url_filter,
+                    not_found="fallback",
+                    update=record_har,
+                    update_content="embed",
+                    update_mode="minimal",
+                )
+
+            cls.current_context = cls.contexts.add(new_context, recyclable=har_path is None).name
         else:
             raise Exception("Browser not initialized. Call init_browser first.")
 
     @classmethod
-    def _get_current_context_payload(cls) -> dict[str, Any]:
+    def reset_workspace(cls) -> None:
+        """Clear cookies and storage of the current context instead of rebuilding it"""
+        if cls.pool is None:
+            raise Exception("Browser not initialized. Call init_browser first.")
+        entry = cls._get_current_context_payload()
+        cls.pool.reset(entry.context)
+        entry.pages = entry.context.pages[:1]
+        entry.selected_page = 1
+
+    @classmethod
+    def close_workspace(cls) -> None:
+        """Close the current context and switch back to the previously created one
+
+        Closing also flushes a HAR file that is being recorded.
+        """
+        if cls.current_context is None:
+            raise ValueError("No context selected")
+
+        cls._release_entry(cls.contexts.remove(cls.current_context))
+        previous = cls.contexts.last()
+        cls.current_context = previous.name if previous else None
+
+    @classmethod
+    def _release_entry(cls, entry: ContextEntry) -> None:
+        """Return a context to the pool, or close it if it has routes that must not be recycled"""
+        if cls.pool is None:
+            raise Exception("Browser not initialized. Call init_browser first.")
+        if entry.recyclable:
+            cls.pool.release(entry.context)
+        else:
+            cls.pool.discard(entry.context)
+
+    @classmethod
+    def _get_current_context_payload(cls) -> ContextEntry:
         """Get the current context data"""
         if cls.current_context is None:
             raise ValueError("No context selected")
-        return cls.contexts[cls.current_context]
+        return cls.contexts.get(cls.current_context)
 
     @classmethod
     def get_driver(cls) -> Page:
         """Get the current page"""
         if cls.current_context is None:
             raise ValueError("Driver is not initialized, call Driver.new_workspace first.")
-        context = cls._get_current_context_payload()
-        return context["pages"][context["selected_page"] - 1]
+        return cls._get_current_context_payload().page
 
     @classmethod
     def close_contexts(cls) -> None:
-        """Close all browser contexts"""
-        for _context_name, context_data in cls.contexts.items():
-            context_data["context"].close()
-        cls.contexts = {}
+        """Release all browser contexts back to the worker pool"""
+        cls.navigation_timing.save()
+        cls.page_metrics.save()
+        cls.locator_timing.save()
+        cls.adaptive_timeouts.update(cls.locator_timing.get_stats())
+        for entry in cls.contexts.clear():
+            cls._release_entry(entry)
         cls.current_context = None
 
     @classmethod
     def close_browser(cls) -> None:
-        """Close the browser instance"""
-        if cls.browser:
-            cls.browser.close()
-            cls.browser = None
+        """Close the browser instance together with its pooled contexts"""
+        if cls.pool:
+            cls.pool.close()
+            cls.pool = None
+        cls.browser = None
 
     @classmethod
     def new_page(cls) -> Page:
-        """Create a new page in the current context"""
-        if cls.current_context is None:
-            raise ValueError("No context selected")
-
-        context_data = cls._get_current_context_payload()
-        context: BrowserContext = context_data["context"]
-        page = context.new_page()
-        context_data["pages"].append(page)
-        context_data["selected_page"] = len(context_data["pages"])
+        """Create a new page in the current context, closing its oldest page above the page limit"""
+        entry = cls._get_current_context_payload()
+        page = entry.context.new_page()
+        cls.contexts.add_page(entry, page)
         return page
 
     @classmethod
-    def goto(cls, url: str) -> None:
-        """Navigate to the specified URL"""
-        cls.get_driver().goto(url)
+    def goto(cls, url: str, client_side: bool | None = None) -> None:
+        """Navigate to the specified URL and wait until the page is ready
+
+        The ready signal comes from the readiness strategy registered for the route,
+        routes without a strategy wait for the load event. The navigation timing is recorded.
+
+        Args:
+            url: URL to open
+            client_side: Try in-app history navigation first when the app is already loaded
+                (SPA_NAVIGATION setting by default), falling back to a full page load
+        """
+        page = cls.get_driver()
+        strategy = cls.readiness.get(url)
+        cls.navigation_timing.collect(page)
+
+        if base_settings.spa_navigation if client_side is None else client_side:
+            started_at = time.perf_counter()
+            if cls._navigate_client_side(page, url, strategy):
+                cls.navigation_timing.record_client_side(url, (time.perf_counter() - started_at) * 1000)
+                return
+
+        page.goto(url, wait_until=strategy.wait_until)
+        committed_url = page.url
+        strategy.wait(page)
+        cls.navigation_timing.start(page, url, committed_url)
+
+    @staticmethod
+    def _navigate_client_side(page: Page, url: str, strategy: ReadinessStrategy) -> bool:
+        """Move to the URL with the app router instead of reloading the document
+
+        Returns:
+            True if the page became ready, False if a full navigation is needed
+        """
+        current, target = urlparse(page.url), urlparse(url)
+        # Only the ready selector tells the new route apart from the previous one
+        if (current.scheme, current.netloc) != (target.scheme, target.netloc) or not strategy.selector:
+            return False
+        # The router doesn't render the current route again, only a full navigation reloads it
+        if (current.path, current.query) == (target.path, target.query):
+            return False
+
+        strategy.mark_stale(page)
+        path = target.path + (f"?{target.query}" if target.query else "")
+        arg = {"path": path, "staleSelector": f"[{STALE_ATTRIBUTE}]", "timeout": base_settings.spa_router_response_timeout}
+        # A route that reuses the elements of the previous page never clears the stale marks
+        if not page.evaluate(CLIENT_SIDE_NAVIGATE_SCRIPT, arg):
+            return False
+        try:
+            strategy.wait(page, timeout=base_settings.spa_navigation_timeout, skip_stale=True)
+        except PlaywrightTimeoutError:
+            return False
+        return True
+
+    @classmethod
+    def start_trace_chunk(cls, title: str) -> None:
+        """Start a trace chunk for a test in the current context"""
+        cls.tracer.start_chunk(cls.get_driver().context, title)
+
+    @classmethod
+    def stop_trace_chunk(cls, title: str, keep: bool) -> Path | None:
+        """Stop the current trace chunk, saving it only if it should be kept"""
+        return cls.tracer.stop_chunk(title, keep)
+
+    @classmethod
+    def set_auth_state(cls, role: str) -> None:
+        """Save authentication state of the current context for the given role"""
+        cls.auth_cache.save(role, cls.get_driver().context.storage_state())
 
     @classmethod
-    def set_auth_state(cls, auth_state: dict) -> None:
-        """Save authentication state"""
-        cls.auth_state_path.parent.mkdir(exist_ok=True)
-        cls.get_driver().context.storage_state(path=cls.auth_state_path)
+    def restore_auth_state(cls, role: str) -> bool:
+        """Apply a cached authentication state for the given role to the current context
+
+        Returns:
+            True if a valid state was found and applied, False otherwise
+        """
+        state = cls.auth_cache.load(role)
+        if state is None:
+            return False
+        apply_storage_state(cls.get_driver().context, state)
+        return True
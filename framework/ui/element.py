@@ -1,12 +1,115 @@
+import copy
+import functools
+import inspect
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Union
+from typing import Any, Self, TypeVar, Union
 
-from playwright.sync_api import Locator, expect
+from playwright.sync_api import Locator, Page, expect
 
+from framework.ui.dom_wait import Condition, wait_for_condition
 from framework.ui.driver import Driver
+from framework.ui.locator_timing import get_call_site
+from framework.ui.snapshot import SNAPSHOT_SCRIPT, ElementSnapshot
 
 OP_COMMON_TIMEOUT = 10000
 
+E = TypeVar("E", bound="BaseElement")
+
+# Sets form controls found by name through the native value setters, which React's value
+# tracking doesn't intercept, and dispatches the input and change events React listens to.
+# Checkboxes and radios are clicked, so React sees the same event as from a user.
+FILL_FIELDS_SCRIPT = """
+(root, { fields, timeout }) => new Promise((resolve) => {
+    const find = (name) => {
+        const escaped = CSS.escape(name);
+        return root.querySelector(`input[name="${escaped}"], textarea[name="${escaped}"], select[name="${escaped}"]`);
+    };
+    // Like Locator.fill, wait until every control is rendered and editable
+    const isReady = (el) => !!el && !el.disabled && !el.readOnly;
+    const fill = () => {
+        const missing = [];
+        for (const [name, value] of Object.entries(fields)) {
+            const el = find(name);
+            if (!isReady(el)) {
+                missing.push(name);
+                continue;
+            }
+            if (el.type === "checkbox" || el.type === "radio") {
+                if (el.checked !== value) el.click();
+                continue;
+            }
+            const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set;
+            setter.call(el, String(value));
+            el.dispatchEvent(new Event("input", { bubbles: true }));
+            el.dispatchEvent(new Event("change", { bubbles: true }));
+        }
+        return missing;
+    };
+    const finish = () => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(fill());
+    };
+    const observer = new MutationObserver(() => {
+        if (Object.keys(fields).every((name) => isReady(find(name)))) finish();
+    });
+    const timer = setTimeout(finish, timeout);
+    if (Object.keys(fields).every((name) => isReady(find(name)))) {
+        finish();
+        return;
+    }
+    observer.observe(root, { subtree: true, childList: true, attributes: true });
+})
+"""
+
+
+def timed_action(method: Callable) -> Callable:
+    """Record the duration of an element action in Driver.locator_timing, for sync and async actions"""
+
+    def record(element: "BaseElement", started_at: float, failed: bool) -> None:
+        duration = (time.perf_counter() - started_at) * 1000
+        Driver.locator_timing.record(element._get_timing_key(), method.__name__, duration, get_call_site(), failed)
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            recorder = Driver.locator_timing
+            if not recorder.enabled or recorder.depth.get():
+                return await method(self, *args, **kwargs)
+            token = recorder.depth.set(1)
+            started_at = time.perf_counter()
+            failed = True
+            try:
+                result = await method(self, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                recorder.depth.reset(token)
+                record(self, started_at, failed)
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        recorder = Driver.locator_timing
+        if not recorder.enabled or recorder.depth.get():
+            return method(self, *args, **kwargs)
+        token = recorder.depth.set(1)
+        started_at = time.perf_counter()
+        failed = True
+        try:
+            result = method(self, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            recorder.depth.reset(token)
+            record(self, started_at, failed)
+
+    return wrapper
+
 
 @dataclass
 class By:
@@ -20,6 +123,16 @@ class By:
 
 
 class BaseElement:
+    """Element definition resolved lazily against its parent or the current page
+
+    The definition is immutable once set: chain() and calling the element return new
+    elements instead of changing the existing one, so definitions can be created once,
+    shared between page objects, threads and asyncio tasks, and memoized safely.
+    """
+
+    # Attributes that define what the element resolves to
+    _DEFINITION = ("search_by", "search_locator", "parent", "ignore_parent", "exact_text", "_locator_kwargs")
+
     def __init__(
         self,
         search_by: str,
@@ -34,41 +147,82 @@ class BaseElement:
         self.ignore_parent = ignore_parent
         self.exact_text = exact_text
 
-    def __call__(self, *args, **kwargs):
-        if kwargs.get("parent"):
-            self.parent = kwargs["parent"]
-        self._locator_kwargs = kwargs
-        return self
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._DEFINITION and name in self.__dict__:
+            raise AttributeError(f"{type(self).__name__}.{name} can't be changed, derive a new element with chain() or a call")
+        super().__setattr__(name, value)
 
-    def _get_locator(self) -> Locator:
-        locator: Locator
+    def __call__(self, *args, **kwargs) -> Self:
+        """Derive an element with the locator formatted by kwargs and optionally another parent"""
+        return self._replace(parent=kwargs.get("parent") or self.parent, _locator_kwargs=kwargs)
+
+    def _replace(self, **changes: Any) -> Self:
+        """Copy the element with changed definition attributes"""
+        element = copy.copy(self)
+        element.__dict__.update(changes)
+        return element
+
+    def _format_locator(self) -> str:
         if hasattr(self, "_locator_kwargs"):
-            formatted_locator = self.search_locator.format(**self._locator_kwargs)
-        elif hasattr(self, "search_locator"):
-            formatted_locator = self.search_locator
+            return self.search_locator.format(**self._locator_kwargs)
+        if hasattr(self, "search_locator"):
+            return self.search_locator
+        return ""
+
+    @staticmethod
+    def _get_root() -> Page:
+        """Page used to resolve elements without a parent"""
+        return Driver.get_driver()
+
+    def _get_locator(self) -> Locator:
+        """Resolve the element against its parent or the current page
+
+        Locators are lazy and built on the client, so resolving the chain on every action
+        costs no round-trip to the browser.
+        """
+        if not self.parent or self.ignore_parent:
+            scope = self._get_root()
         else:
-            formatted_locator = ""
-
-        driver = (
-            (self.parent._get_locator() if isinstance(self.parent, BaseElement) else self.parent)
-            if (self.parent and not self.ignore_parent)
-            else Driver().get_driver()
-        )
-        resolve_method = getattr(driver, self.search_by)
-        locator = resolve_method(formatted_locator)
+            scope = self.parent._get_locator() if isinstance(self.parent, BaseElement) else self.parent
+        locator: Locator = getattr(scope, self.search_by)(self._format_locator())
         return locator
 
-    def chain(self, element: "BaseElement"):
-        element.parent = self
-        return element
-
+    def _get_timing_key(self) -> str:
+        """Describe the locator of the element for timing statistics, "a >> b" for By.LOCATOR chains"""
+        selector = self._format_locator() if self.search_by == By.LOCATOR else f"{self.search_by}({self._format_locator()})"
+        if self.parent is None or self.ignore_parent:
+            return selector
+        parent = self.parent._get_timing_key() if isinstance(self.parent, BaseElement) else "<locator>"
+        return f"{parent} >> {selector}"
+
+    def _get_timeout(self, timeout: int | None) -> int:
+        """Resolve the timeout of an action: explicit, learned from previous runs or OP_COMMON_TIMEOUT"""
+        if timeout is not None:
+            return timeout
+        if not Driver.adaptive_timeouts.enabled:
+            return OP_COMMON_TIMEOUT
+        learned = Driver.adaptive_timeouts.get(self._get_timing_key())
+        return OP_COMMON_TIMEOUT if learned is None else learned
+
+    def _assert_condition(self, condition: Condition, expected: Any, timeout: int | None, description: str) -> None:
+        timeout = self._get_timeout(timeout)
+        if not wait_for_condition(self._get_locator(), condition, expected, timeout):
+            raise AssertionError(f"{self._get_timing_key()} {description} within {timeout} ms")
+
+    def chain(self, element: E) -> E:
+        """Derive a copy of the element nested in this one"""
+        return element._replace(parent=self)
+
+    @timed_action
     def hover(self, **kwargs):
         self._get_locator().hover(**kwargs)
         return self
 
+    @timed_action
     def all(self) -> list[Locator]:
         return self._get_locator().all()
 
+    @timed_action
     def count(self) -> int:
         """Get the number of elements matching this locator
 
@@ -77,6 +231,7 @@ class BaseElement:
         """
         return self._get_locator().count()
 
+    @timed_action
     def get_attribute(self, attribute_name: str) -> str:
         """Get the value of an attribute from the element
 
@@ -88,6 +243,7 @@ class BaseElement:
         """
         return self._get_locator().get_attribute(attribute_name) or ""
 
+    @timed_action
     def get_class_list(self) -> list[str]:
         """Get the list of CSS classes applied to the element
 
@@ -97,6 +253,7 @@ class BaseElement:
         class_attr = self.get_attribute("class")
         return class_attr.split() if class_attr else []
 
+    @timed_action
     def is_enabled(self) -> bool:
         """Check if the element is enabled
 
@@ -104,59 +261,115 @@ class BaseElement:
             True if the element is enabled, False otherwise
         """
         locator = self._get_locator()
-        return locator.is_enabled() and "disabled" not in self.get_class_list()
+        class_attr = locator.get_attribute("class") or ""
+        return locator.is_enabled() and "disabled" not in class_attr.split()
 
-    def should_be_visible(self, should_visible: bool = True, timeout: int = OP_COMMON_TIMEOUT) -> "BaseElement":
-        locator = self._get_locator()
-        expect(locator).to_be_visible(visible=should_visible, timeout=timeout)
+    @timed_action
+    def snapshot(self) -> ElementSnapshot:
+        """Read text, attributes, classes, visibility, enabled state and bounding box at once
+
+        Returns:
+            Immutable snapshot of the element, read in a single evaluation in the page
+        """
+        return ElementSnapshot.from_script(self._get_locator().evaluate(SNAPSHOT_SCRIPT))
+
+    @timed_action
+    def should_be_visible(self, should_visible: bool = True, timeout: int | None = None) -> "BaseElement":
+        condition: Condition = "visible" if should_visible else "hidden"
+        self._assert_condition(condition, None, timeout, "is not visible" if should_visible else "is still visible")
         return self
 
+    @timed_action
     def is_visible(self) -> bool:
         return self._get_locator().is_visible()
 
+    @timed_action
     def is_exists(self) -> bool:
         return self._get_locator().count() > 0
 
-    def click(self, timeout: int = OP_COMMON_TIMEOUT, force: bool = False) -> "BaseElement":
-        self._get_locator().click(timeout=timeout, force=force)
+    @timed_action
+    def click(self, timeout: int | None = None, force: bool = False) -> "BaseElement":
+        self._get_locator().click(timeout=self._get_timeout(timeout), force=force)
         return self
 
-    def fill(self, value: str, timeout: int = OP_COMMON_TIMEOUT) -> "BaseElement":
-        self._get_locator().fill(value, timeout=timeout)
+    @timed_action
+    def fill(self, value: str, timeout: int | None = None) -> "BaseElement":
+        self._get_locator().fill(value, timeout=self._get_timeout(timeout))
+        return self
+
+    @timed_action
+    def fill_fields(self, fields: dict[str, str | int | float | bool], timeout: int | None = None) -> "BaseElement":
+        """Set several form controls inside the element in a single evaluation
+
+        Use it for plain inputs, textareas, native selects and checkboxes. Custom comboboxes and
+        tag pickers need real interaction and are filled with individual actions. A single field
+        is better filled with fill, which also waits for the control to be visible.
+
+        Args:
+            fields: Values by the name attribute of the control, booleans for checkboxes
+            timeout: Maximum time in milliseconds to wait for the controls to be rendered and editable
+
+        Raises:
+            ValueError: If a control is not found or not editable inside the element
+        """
+        timeout = self._get_timeout(timeout)
+        missing = self._get_locator().evaluate(FILL_FIELDS_SCRIPT, {"fields": fields, "timeout": timeout}, timeout=timeout)
+        if missing:
+            raise ValueError(f"Form controls not found or not editable: {', '.join(missing)}")
         return self
 
-    def press(self, key: str, timeout: int = OP_COMMON_TIMEOUT) -> "BaseElement":
-        self._get_locator().press(key, timeout=timeout)
+    @timed_action
+    def press(self, key: str, timeout: int | None = None) -> "BaseElement":
+        self._get_locator().press(key, timeout=self._get_timeout(timeout))
         return self
 
-    def check(self, timeout: int = OP_COMMON_TIMEOUT, force: bool = False) -> "BaseElement":
-        self._get_locator().check(timeout=timeout, force=force)
+    @timed_action
+    def check(self, timeout: int | None = None, force: bool = False) -> "BaseElement":
+        self._get_locator().check(timeout=self._get_timeout(timeout), force=force)
         return self
 
-    def uncheck(self, timeout: int = OP_COMMON_TIMEOUT, force: bool = False) -> "BaseElement":
-        self._get_locator().uncheck(timeout=timeout, force=force)
+    @timed_action
+    def uncheck(self, timeout: int | None = None, force: bool = False) -> "BaseElement":
+        self._get_locator().uncheck(timeout=self._get_timeout(timeout), force=force)
         return self
 
+    @timed_action
     def get_text(self) -> str:
         return self._get_locator().text_content() or ""
 
-    def should_have_text(self, text: str, exact: bool = False) -> "BaseElement":
-        expect(self._get_locator()).to_have_text(text, exact=exact)
+    @timed_action
+    def should_have_text(self, text: str, exact: bool = False, timeout: int | None = None) -> "BaseElement":
+        self._assert_condition("text", {"text": text, "exact": exact}, timeout, f"doesn't have text {text!r}")
         return self
 
-    def should_be_enabled(self, enabled: bool = True) -> "BaseElement":
-        expect(self._get_locator()).to_be_enabled(enabled=enabled)
+    @timed_action
+    def should_be_enabled(self, enabled: bool = True, timeout: int | None = None) -> "BaseElement":
+        self._assert_condition("enabled", enabled, timeout, "is not enabled" if enabled else "is not disabled")
         return self
 
+    @timed_action
     def should_be_disabled(self) -> "BaseElement":
         return self.should_be_enabled(enabled=False)
 
+    @timed_action
     def should_have_count(self, count: int) -> "BaseElement":
         expect(self._get_locator()).to_have_count(count)
         return self
 
-    def wait_for(self, timeout: int = OP_COMMON_TIMEOUT) -> "BaseElement":
-        self._get_locator().wait_for(timeout=timeout)
+    @timed_action
+    def wait_for_stable(self, idle: int = 100, timeout: int | None = None) -> "BaseElement":
+        """Wait until nothing changes inside the element for a while
+
+        Args:
+            idle: Time without DOM mutations inside the element in milliseconds
+            timeout: Maximum time in milliseconds
+        """
+        self._assert_condition("idle", idle, timeout, f"didn't settle for {idle} ms")
+        return self
+
+    @timed_action
+    def wait_for(self, timeout: int | None = None) -> "BaseElement":
+        self._get_locator().wait_for(timeout=self._get_timeout(timeout))
         return self
 
     def get_child_locator(self, locator: str) -> "BaseElement":
@@ -0,0 +1,135 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+from http import HTTPStatus
+from pathlib import Path
+from weakref import WeakSet
+
+import requests
+from playwright.sync_api import BrowserContext, Route
+
+from config import base_settings
+from framework.ui.browser_pool import get_app_origin
+
+CACHED_RESOURCE_TYPES = ("script", "stylesheet", "font", "image")
+# Headers that no longer describe the body once it was decoded by route.fetch
+DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+# Scripts and styles referenced by the entry page, their URLs change with every build
+ASSET_REFERENCE_PATTERN = re.compile(r"<(?:script|link)\b[^>]*?\b(?:src|href)=[\"']([^\"']+)[\"']", re.IGNORECASE)
+# Attributes that change with every response of the same build
+VOLATILE_ATTRIBUTE_PATTERN = re.compile(r"\b(?:nonce|integrity)=[\"'][^\"']*[\"']", re.IGNORECASE)
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """On-disk cache of static assets shared by all contexts and workers
+
+    Browser contexts start with an empty HTTP cache, and routing (used for resource blocking
+    and HAR replay) disables it completely. This cache serves scripts, styles, fonts and images
+    from a versioned directory through a context route instead. The version is taken from the
+    HTTP_CACHE_VERSION setting or from a hash of the asset URLs in the application entry page,
+    so a new app build gets a new cache directory. Directories of older builds are removed by
+    prune, which runs once per session before any worker uses the cache.
+    """
+
+    def __init__(self, enabled: bool | None = None, cache_dir: Path | None = None):
+        self.enabled = base_settings.http_cache if enabled is None else enabled
+        self.cache_dir = cache_dir or Path(base_settings.http_cache_dir)
+        self.version_dir: Path | None = None
+        self._contexts: WeakSet[BrowserContext] = WeakSet()
+
+    @staticmethod
+    def get_build_version() -> str:
+        """Identify the app build by the HTTP_CACHE_VERSION setting or the asset URLs of the entry page
+
+        The bundler puts content hashes into the asset file names, so their URLs identify the
+        build. Pages without such references are hashed without their per-response attributes.
+        """
+        if base_settings.http_cache_version:
+            return base_settings.http_cache_version
+        response = requests.get(get_app_origin(), timeout=10)
+        response.raise_for_status()
+        html = response.text
+        assets = sorted(set(ASSET_REFERENCE_PATTERN.findall(html)))
+        identity = "\n".join(assets) if assets else VOLATILE_ATTRIBUTE_PATTERN.sub("", html)
+        return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+    def _resolve_version_dir(self) -> bool:
+        """Resolve the cache directory of the current app build once per process
+
+        A failure disables the cache, so it is not retried for every context or asset.
+        """
+        if self.enabled and self.version_dir is None:
+            try:
+                version_dir = self.cache_dir / self.get_build_version()
+                version_dir.mkdir(parents=True, exist_ok=True)
+            except (requests.RequestException, OSError) as error:
+                logger.warning("HTTP cache disabled, the app build version could not be resolved: %s", error)
+                self.enabled = False
+            else:
+                self.version_dir = version_dir
+        return self.enabled
+
+    def prune(self) -> None:
+        """Remove the cache directories of other app builds
+
+        Must run before the workers start, as they read and write the current directory.
+        """
+        if not self._resolve_version_dir():
+            return
+        for path in self.cache_dir.iterdir():
+            if path.is_dir() and path != self.version_dir:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def install(self, context: BrowserContext) -> None:
+        """Register the cache route on a context, once per context"""
+        if context in self._contexts or not self._resolve_version_dir():
+            return
+        context.route("**/*", self._handle_route)
+        self._contexts.add(context)
+
+    def _handle_route(self, route: Route) -> None:
+        request = route.request
+        if request.method != "GET" or request.resource_type not in CACHED_RESOURCE_TYPES or self.version_dir is None:
+            route.fallback()
+            return
+
+        try:
+            self._serve(route, self.version_dir)
+        except Exception as error:
+            # A broken cache must never leave the request pending, the network serves it instead
+            logger.warning("HTTP cache failed for %s, falling back to the network: %s", request.url, error)
+            route.fallback()
+
+    def _serve(self, route: Route, version_dir: Path) -> None:
+        request = route.request
+
+        key = hashlib.sha256(request.url.encode()).hexdigest()
+        body_path = version_dir / key
+        meta_path = body_path.with_suffix(".json")
+        if body_path.exists() and meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            route.fulfill(status=meta["status"], headers=meta["headers"], body=body_path.read_bytes())
+            return
+
+        response = route.fetch()
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS}
+        body = response.body()
+        if response.status == HTTPStatus.OK and "no-store" not in response.headers.get("cache-control", ""):
+            # The response is served even if it can't be stored
+            with contextlib.suppress(OSError):
+                self._store(body_path, body)
+                self._store(meta_path, json.dumps({"url": request.url, "status": response.status, "headers": headers}).encode())
+        route.fulfill(status=response.status, headers=headers, body=body)
+
+    @staticmethod
+    def _store(path: Path, data: bytes) -> None:
+        # Written to a temporary file first, so other workers never read a partial entry
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
@@ -1,9 +1,12 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from types import MappingProxyType
 from typing import Optional, TypeVar
 
 from playwright.sync_api import Locator
 
-from framework.ui.element import BaseElement, By
+from framework.ui.element import BaseElement, By, timed_action
+from framework.ui.predicates import MATCH_SCRIPT, Predicate, text_contains
+from framework.ui.snapshot import ITEMS_SCRIPT, SNAPSHOT_ALL_SCRIPT, ElementSnapshot, ItemSnapshot
 
 T = TypeVar("T")
 
@@ -22,26 +25,67 @@ class ListElement[T](BaseElement):
         super().__init__(search_by, locator, parent, ignore_parent)
         self.item_factory = item_factory
 
-    def __iter__(self):
-        locator = self._get_locator()
-        count = locator.count()
-        for i in range(count):
-            yield self.item_factory(locator.nth(i), i)
+    def __iter__(self) -> Iterator[T]:
+        # Counted in the same evaluation that reads the items, their locators are created lazily
+        for item in self.materialize():
+            yield self.item_factory(item.locator, item.index)
 
     def __getitem__(self, index: int) -> T:
         return self.item_factory(self._get_locator().nth(index), index)
 
+    @timed_action
     def count(self) -> int:
         return self._get_locator().count()
 
-    def filter(self, predicate: Callable[[T], bool]) -> list[T]:
-        return [item for item in self if predicate(item)]
+    @timed_action
+    def snapshot(self) -> list[ElementSnapshot]:
+        """Read the state of all matching elements in a single evaluation
+
+        Returns:
+            Immutable snapshots of the elements in document order
+        """
+        return [ElementSnapshot.from_script(data) for data in self._get_locator().evaluate_all(SNAPSHOT_ALL_SCRIPT)]
+
+    @timed_action
+    def materialize(self) -> list[ItemSnapshot]:
+        """Read text and attributes of all items in a single evaluation
 
-    def find(self, predicate: Callable[[T], bool]) -> T | None:
-        for item in self:
-            if predicate(item):
-                return item
-        return None
+        Returns:
+            Item snapshots in document order, their locators are created only when used
+        """
+        locator = self._get_locator()
+        items = locator.evaluate_all(ITEMS_SCRIPT)
+        return [ItemSnapshot(index, item["text"], MappingProxyType(item["attributes"]), locator) for index, item in enumerate(items)]
+
+    @timed_action
+    def query(self, predicate: Predicate, first: bool = False) -> list[ItemSnapshot]:
+        """Find the items matching the predicate in the page, only the matches are returned
+
+        Args:
+            predicate: Condition built with framework.ui.predicates
+            first: Stop at the first match
+        """
+        locator = self._get_locator()
+        items = locator.evaluate_all(MATCH_SCRIPT, {"predicate": predicate.spec, "first": first})
+        return [ItemSnapshot(item["index"], item["text"], MappingProxyType(item["attributes"]), locator) for item in items]
+
+    def filter(self, predicate: Callable[[ItemSnapshot], bool] | Predicate) -> list[T]:
+        """Get the items matching the predicate
+
+        A Predicate is evaluated in the page. A callable gets the snapshot of every item, all
+        items are read in a single evaluation.
+        """
+        if isinstance(predicate, Predicate):
+            return [self.item_factory(item.locator, item.index) for item in self.query(predicate)]
+        return [self.item_factory(item.locator, item.index) for item in self.materialize() if predicate(item)]
+
+    def find(self, predicate: Callable[[ItemSnapshot], bool] | Predicate) -> T | None:
+        """Get the first item matching the predicate, see filter"""
+        if isinstance(predicate, Predicate):
+            item = next(iter(self.query(predicate, first=True)), None)
+        else:
+            item = next((item for item in self.materialize() if predicate(item)), None)
+        return None if item is None else self.item_factory(item.locator, item.index)
 
 
 class Grid(BaseElement):
@@ -54,13 +98,17 @@ class Grid(BaseElement):
         parent: BaseElement | Locator | None = None,
     ):
         super().__init__(search_by, locator, parent)
-        self.rows = ListElement(By.LOCATOR, "tbody > tr", lambda loc, idx: GridRow(loc, idx, self), self)
+
+    @property
+    def rows(self) -> ListElement["GridRow"]:
+        # Built on access, so grids derived by chain() list their own rows
+        return ListElement(By.LOCATOR, "tbody > tr", lambda loc, idx: GridRow(loc, idx, self), self)
 
     def get_row(self, index: int) -> "GridRow":
         return self.rows[index]
 
     def find_row_by_text(self, text: str) -> Optional["GridRow"]:
-        return self.rows.find(lambda row: text in row.get_text())
+        return self.rows.find(text_contains(text))
 
 
 class GridRow:
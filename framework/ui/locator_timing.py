@@ -0,0 +1,141 @@
+import json
+import os
+import sys
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from config import base_settings
+from framework.ui.browser_pool import get_worker_id
+
+# Upper bounds of the histogram buckets in milliseconds, the last bucket is unbounded
+BUCKETS = (5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000)
+FRAMEWORK_DIR = str(Path(__file__).parent)
+
+
+def get_call_site() -> str:
+    """Get the first stack frame outside the framework as "path:line" """
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.startswith(FRAMEWORK_DIR):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+def get_percentile(buckets: list[int], percentile: float) -> float:
+    """Estimate a percentile from histogram bucket counts
+
+    Args:
+        buckets: Counts per bucket of BUCKETS plus the unbounded one
+        percentile: Percentile between 0 and 100
+
+    Returns:
+        Estimated value in milliseconds, interpolated linearly within its bucket
+    """
+    total = sum(buckets)
+    if not total:
+        return 0.0
+    rank = total * percentile / 100
+    seen = 0
+    for index, count in enumerate(buckets):
+        if count and seen + count >= rank:
+            lower = BUCKETS[index - 1] if index else 0
+            upper = BUCKETS[index] if index < len(BUCKETS) else BUCKETS[-1] * 2
+            return lower + (upper - lower) * (rank - seen) / count
+        seen += count
+    return float(BUCKETS[-1] * 2)
+
+
+class LocatorTimingRecorder:
+    """Aggregates durations of element actions into per-locator histograms
+
+    Only the outermost action is timed, so should_be_disabled is recorded once and not
+    again as should_be_enabled. Each locator keeps the count of calls per action and per
+    call site, which is the first stack frame outside the framework. Failed actions count
+    towards the totals but not the histogram, where their timeouts would hide the latency.
+    """
+
+    def __init__(self, enabled: bool | None = None, report_path: Path | None = None):
+        # Adaptive timeouts learn from the same histograms
+        self.enabled = (base_settings.collect_locator_timing or base_settings.adaptive_timeouts) if enabled is None else enabled
+        report_path = report_path or Path(base_settings.locator_timing_report)
+        self.report_path = report_path.with_stem(f"{report_path.stem}_{get_worker_id()}")
+        self.stats: dict[str, dict[str, Any]] = {}
+        self.depth: ContextVar[int] = ContextVar("locator_timing_depth", default=0)
+
+    @staticmethod
+    def _new_stats() -> dict[str, Any]:
+        return {
+            "count": 0,
+            "failures": 0,
+            "total": 0.0,
+            "max": 0.0,
+            "buckets": [0] * (len(BUCKETS) + 1),
+            "actions": Counter(),
+            "call_sites": Counter(),
+        }
+
+    def record(self, locator: str, action: str, duration: float, call_site: str, failed: bool = False) -> None:
+        """Add an action duration in milliseconds to the statistics of a locator"""
+        stats = self.stats.get(locator)
+        if stats is None:
+            stats = self.stats[locator] = self._new_stats()
+        stats["count"] += 1
+        stats["total"] += duration
+        stats["max"] = max(stats["max"], duration)
+        if failed:
+            stats["failures"] += 1
+        else:
+            stats["buckets"][next((i for i, bound in enumerate(BUCKETS) if duration <= bound), len(BUCKETS))] += 1
+        stats["actions"][action] += 1
+        stats["call_sites"][call_site] += 1
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Statistics in a JSON serializable form, suitable for pytest-xdist worker output"""
+        return {
+            locator: {**stats, "actions": dict(stats["actions"]), "call_sites": dict(stats["call_sites"])}
+            for locator, stats in self.stats.items()
+        }
+
+    @staticmethod
+    def merge(stats_list: list[dict[str, dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+        """Combine statistics of several workers"""
+        merged: dict[str, dict[str, Any]] = {}
+        for stats in stats_list:
+            for locator, item in stats.items():
+                target = merged.get(locator)
+                if target is None:
+                    target = merged[locator] = LocatorTimingRecorder._new_stats()
+                target["count"] += item["count"]
+                target["failures"] += item["failures"]
+                target["total"] += item["total"]
+                target["max"] = max(target["max"], item["max"])
+                target["buckets"] = [a + b for a, b in zip(target["buckets"], item["buckets"], strict=True)]
+                target["actions"].update(item["actions"])
+                target["call_sites"].update(item["call_sites"])
+        return merged
+
+    @staticmethod
+    def get_slowest(stats: dict[str, dict[str, Any]], limit: int) -> list[tuple[str, dict[str, Any]]]:
+        """Locators with the largest total time, slowest first"""
+        return sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True)[:limit]
+
+    def save(self) -> None:
+        """Write the histograms with p50 and p99 estimates per locator"""
+        if not self.stats:
+            return
+
+        report = {}
+        for locator, stats in self.get_slowest(self.get_stats(), len(self.stats)):
+            call_sites = {os.path.relpath(site): count for site, count in stats["call_sites"].items()}
+            report[locator] = {
+                **stats,
+                "p50": get_percentile(stats["buckets"], 50),
+                "p99": get_percentile(stats["buckets"], 99),
+                "call_sites": call_sites,
+            }
+
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.report_path.write_text(json.dumps({"buckets": BUCKETS, "locators": report}, indent=2), encoding="utf-8")
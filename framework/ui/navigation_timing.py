@@ -0,0 +1,139 @@
+import json
+import statistics
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary, WeakSet
+
+from playwright.sync_api import BrowserContext, Error, Page
+
+from common.routes import match_ui_route
+from config import base_settings
+from framework.ui.browser_pool import get_worker_id
+
+# Marks the moment the first ag-grid body row is attached to the DOM
+FIRST_GRID_ROW_SCRIPT = """
+(() => {
+    const selector = ".ag-center-cols-container [role='row']";
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) {
+            window.__firstGridRowAt = performance.now();
+            observer.disconnect();
+        }
+    });
+    observer.observe(document, { childList: true, subtree: true });
+    // Pages without a grid stop observing after a while
+    setTimeout(() => observer.disconnect(), 30000);
+})();
+"""
+
+NAVIGATION_TIMING_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    if (!nav) return null;
+    // Event ends are 0 until the event has fired, which is no sample
+    return {
+        name: nav.name,
+        type: nav.type,
+        dns: nav.domainLookupEnd - nav.domainLookupStart,
+        connect: nav.connectEnd - nav.connectStart,
+        ttfb: nav.responseStart - nav.requestStart,
+        dom_content_loaded: nav.domContentLoadedEventEnd || null,
+        load: nav.loadEventEnd || null,
+        first_grid_row: window.__firstGridRowAt ?? null,
+    };
+}
+"""
+
+METRICS = ("dns", "connect", "ttfb", "dom_content_loaded", "load", "first_grid_row", "client_side")
+
+
+class NavigationTimingRecorder:
+    """Collects navigation timings of every Driver.goto grouped by UIRoutes template
+
+    Timings are read lazily: the entry of a navigation is collected right before the page
+    navigates again or when the session ends, so goto never waits for late metrics such as
+    the first rendered grid row. An entry is only recorded if it still belongs to the goto,
+    so a reload or a link followed in between is not attributed to the goto URL.
+    """
+
+    def __init__(self, enabled: bool | None = None, report_path: Path | None = None):
+        self.enabled = base_settings.collect_navigation_timing if enabled is None else enabled
+        report_path = report_path or Path(base_settings.navigation_timing_report)
+        self.report_path = report_path.with_stem(f"{report_path.stem}_{get_worker_id()}")
+        self.samples: dict[str, list[dict[str, Any]]] = {}
+        self._pending: WeakKeyDictionary[Page, tuple[str, str]] = WeakKeyDictionary()
+        self._contexts: WeakSet[BrowserContext] = WeakSet()
+
+    @staticmethod
+    def get_route_template(url: str) -> str:
+        """Get the UIRoutes template matching the URL, or the URL path if there is none"""
+        return match_ui_route(url) or urlparse(url).path or "/"
+
+    def install(self, context: BrowserContext) -> None:
+        """Register the first grid row marker on a context, once per context"""
+        if not self.enabled or context in self._contexts:
+            return
+        context.add_init_script(FIRST_GRID_ROW_SCRIPT)
+        self._contexts.add(context)
+
+    @staticmethod
+    def _get_document_url(url: str) -> str:
+        return urlparse(url)._replace(fragment="").geturl().rstrip("/")
+
+    def start(self, page: Page, url: str, committed_url: str) -> None:
+        """Remember a navigation whose timing is collected later
+
+        Args:
+            page: Navigated page
+            url: Requested URL
+            committed_url: URL of the page right after the navigation, after server redirects
+        """
+        if self.enabled:
+            self._pending[page] = (url, committed_url)
+
+    def collect(self, page: Page) -> None:
+        """Read the timing of the last navigation of the page"""
+        pending = self._pending.pop(page, None)
+        if pending is None or page.is_closed():
+            return
+        try:
+            timing = page.evaluate(NAVIGATION_TIMING_SCRIPT)
+        except Error:
+            return
+        if not timing:
+            return
+        name, navigation_type = timing.pop("name"), timing.pop("type")
+        # The document was reloaded or replaced since the goto
+        if navigation_type != "navigate" or self._get_document_url(name) not in {self._get_document_url(url) for url in pending}:
+            return
+        url = pending[0]
+        self.samples.setdefault(self.get_route_template(url), []).append({"url": url, **timing})
+
+    def record_client_side(self, url: str, duration: float) -> None:
+        """Record an in-app navigation that has no Navigation Timing entry
+
+        Args:
+            url: Target URL
+            duration: Time until the page was ready in milliseconds
+        """
+        if self.enabled:
+            self.samples.setdefault(self.get_route_template(url), []).append({"url": url, "client_side": duration})
+
+    def save(self) -> None:
+        """Collect pending navigations and write the report with samples and medians per route"""
+        for page in list(self._pending.keys()):
+            self.collect(page)
+        if not self.samples:
+            return
+
+        report = {}
+        for route, samples in self.samples.items():
+            medians = {}
+            for metric in METRICS:
+                values = [sample[metric] for sample in samples if sample.get(metric) is not None]
+                medians[metric] = statistics.median(values) if values else None
+            report[route] = {"count": len(samples), "median": medians, "samples": samples}
+
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
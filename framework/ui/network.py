@@ -0,0 +1,90 @@
+from collections import Counter
+from typing import Any
+from urllib.parse import urlparse
+from weakref import WeakSet
+
+from playwright.sync_api import BrowserContext, Request, Route
+
+from config import base_settings
+
+
+class ResourceBlocker:
+    """Context level request filter that drops resources the tests never assert on
+
+    Blocked requests are aborted before they reach the network and counted per resource
+    type and per host. The bytes saved are counted from the request bodies, such as the
+    payloads of analytics beacons, whose size is known when the request is blocked. Response
+    sizes are not measured, as that would take a request to each of the endpoints the
+    blocker keeps the tests away from.
+    """
+
+    def __init__(
+        self,
+        enabled: bool | None = None,
+        resource_types: list[str] | None = None,
+        url_patterns: list[str] | None = None,
+        block_third_party_scripts: bool | None = None,
+    ):
+        self.enabled = base_settings.block_resources if enabled is None else enabled
+        self.resource_types = set(base_settings.blocked_resource_types if resource_types is None else resource_types)
+        self.url_patterns = base_settings.blocked_url_patterns if url_patterns is None else url_patterns
+        self.block_third_party_scripts = (
+            base_settings.block_third_party_scripts if block_third_party_scripts is None else block_third_party_scripts
+        )
+        self.blocked_hosts: Counter[str] = Counter()
+        self.blocked_types: Counter[str] = Counter()
+        self.blocked_bytes = 0
+        self._contexts: WeakSet[BrowserContext] = WeakSet()
+
+    @staticmethod
+    def is_third_party(url: str) -> bool:
+        """Check if the URL is served from outside of the application domain"""
+        hostname = urlparse(url).hostname or ""
+        return hostname != base_settings.domain and not hostname.endswith(f".{base_settings.domain}")
+
+    def should_block(self, request: Request) -> bool:
+        """Check if the request matches any of the blocking rules"""
+        if request.resource_type in self.resource_types:
+            return True
+        if any(pattern in request.url for pattern in self.url_patterns):
+            return True
+        return self.block_third_party_scripts and request.resource_type == "script" and self.is_third_party(request.url)
+
+    @staticmethod
+    def get_body_size(request: Request) -> int:
+        """Size of the request body in bytes, taken from Content-Length when the request sets it"""
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit():
+            return int(content_length)
+        return len(request.post_data_buffer or b"")
+
+    def install(self, context: BrowserContext) -> None:
+        """Register the blocking route on a context, once per context"""
+        if not self.enabled or context in self._contexts:
+            return
+        context.route("**/*", self._handle_route)
+        self._contexts.add(context)
+
+    def _handle_route(self, route: Route) -> None:
+        request = route.request
+        if self.should_block(request):
+            self.blocked_hosts[urlparse(request.url).hostname or "<none>"] += 1
+            self.blocked_types[request.resource_type] += 1
+            self.blocked_bytes += self.get_body_size(request)
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Collect blocking statistics of the current worker
+
+        Returns:
+            Dict with the number of blocked requests, the request body bytes they would have sent
+            and counts per resource type and per host
+        """
+        return {
+            "blocked_requests": sum(self.blocked_types.values()),
+            "blocked_bytes": self.blocked_bytes,
+            "by_type": dict(self.blocked_types),
+            "by_host": dict(self.blocked_hosts),
+        }
@@ -0,0 +1,98 @@
+import json
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import CDPSession, Error, Page
+
+from config import base_settings
+from framework.ui.browser_pool import get_worker_id
+
+# Performance.getMetrics names recorded around page-object actions
+HEAP_METRICS = ("JSHeapUsedSize", "JSHeapTotalSize")
+COUNTER_METRICS = ("LayoutCount", "RecalcStyleCount", "ScriptDuration", "TaskDuration")
+
+
+class PageMetricsRecorder:
+    """Samples JS heap and CPU metrics of a page through a CDP session
+
+    A CDP session is attached to a page on its first sample. Each measured action records
+    the heap size after the action and the growth of layout, style, script and task counters
+    during the action. Nested actions are measured only at the outermost level.
+    """
+
+    def __init__(self, enabled: bool | None = None, report_path: Path | None = None):
+        self.enabled = base_settings.collect_page_metrics if enabled is None else enabled
+        report_path = report_path or Path(base_settings.page_metrics_report)
+        self.report_path = report_path.with_stem(f"{report_path.stem}_{get_worker_id()}")
+        self.samples: list[dict[str, Any]] = []
+        self._sessions: WeakKeyDictionary[Page, CDPSession] = WeakKeyDictionary()
+        self._depth = 0
+
+    def get_metrics(self, page: Page) -> dict[str, float]:
+        """Read the current Performance metrics of the page"""
+        session = self._sessions.get(page)
+        if session is None:
+            session = page.context.new_cdp_session(page)
+            session.send("Performance.enable")
+            self._sessions[page] = session
+        result = session.send("Performance.getMetrics")
+        return {metric["name"]: metric["value"] for metric in result["metrics"]}
+
+    @contextmanager
+    def measure(self, get_page: Callable[[], Page], action: str) -> Generator[None, None, None]:
+        """Record metrics of the page around an action
+
+        Args:
+            get_page: Callable returning the page the action works with
+            action: Action name stored with the sample
+        """
+        if not self.enabled or self._depth:
+            yield
+            return
+
+        try:
+            page = get_page()
+            before = self.get_metrics(page)
+        except (Error, ValueError):
+            # No page is open yet or CDP is not available, the action runs without a sample
+            before = None
+
+        self._depth += 1
+        try:
+            started_at = time.perf_counter()
+            yield
+            duration = time.perf_counter() - started_at
+        finally:
+            self._depth -= 1
+        if before is None:
+            return
+
+        try:
+            after = self.get_metrics(page)
+        except Error:
+            # The action closed or crashed the page
+            return
+        sample = {"action": action, "url": page.url, "duration": duration}
+        sample.update({metric: after.get(metric) for metric in HEAP_METRICS})
+        sample.update({metric: after.get(metric, 0) - before.get(metric, 0) for metric in COUNTER_METRICS})
+        self.samples.append(sample)
+
+    def save(self) -> None:
+        """Write the samples with per-action peaks and totals"""
+        if not self.samples:
+            return
+
+        actions: dict[str, dict[str, Any]] = {}
+        for sample in self.samples:
+            summary = actions.setdefault(sample["action"], {"count": 0, "max_JSHeapUsedSize": 0, **dict.fromkeys(COUNTER_METRICS, 0)})
+            summary["count"] += 1
+            summary["max_JSHeapUsedSize"] = max(summary["max_JSHeapUsedSize"], sample["JSHeapUsedSize"] or 0)
+            for metric in COUNTER_METRICS:
+                summary[metric] += sample[metric]
+
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.report_path.write_text(json.dumps({"actions": actions, "samples": self.samples}, indent=2), encoding="utf-8")
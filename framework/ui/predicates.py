@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import Any
+
+# Evaluates predicate specs against the elements in the page and returns only the matches.
+# Texts are compared with collapsed whitespace, as Playwright compares element texts.
+MATCH_SCRIPT = """
+(elements, { predicate, first }) => {
+    const normalize = (text) => (text ?? "").replace(/\\s+/g, " ").trim();
+    const getCell = (row, column) => typeof column === "number"
+        ? row.querySelectorAll(":scope > td, :scope > [role='gridcell']")[column]
+        : row.querySelector(`[col-id="${CSS.escape(column)}"]`);
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && window.getComputedStyle(el).visibility !== "hidden";
+    };
+    const compare = (text, value, exact) => exact ? normalize(text) === normalize(value) : normalize(text).includes(normalize(value));
+    const match = (el, spec) => {
+        switch (spec.op) {
+            case "text": return compare(el.textContent, spec.value, spec.exact);
+            case "attribute": return el.getAttribute(spec.name) === spec.value;
+            case "cell": {
+                const cell = getCell(el, spec.column);
+                return !!cell && compare(cell.textContent, spec.value, spec.exact);
+            }
+            case "visible": {
+                const target = spec.column === null ? el : getCell(el, spec.column);
+                return !!target && isVisible(target);
+            }
+            case "and": return spec.items.every((item) => match(el, item));
+            case "or": return spec.items.some((item) => match(el, item));
+            case "not": return !match(el, spec.item);
+        }
+        throw new Error(`Unknown predicate ${spec.op}`);
+    };
+    const result = [];
+    for (const [index, el] of elements.entries()) {
+        if (!match(el, predicate)) continue;
+        result.push({
+            index,
+            text: el.textContent ?? "",
+            attributes: Object.fromEntries(Array.from(el.attributes, (attr) => [attr.name, attr.value])),
+        });
+        if (first) break;
+    }
+    return result;
+}
+"""
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """Condition on list items evaluated in the page, combine predicates with &, | and ~"""
+
+    spec: dict[str, Any]
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        return Predicate({"op": "and", "items": [self.spec, other.spec]})
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        return Predicate({"op": "or", "items": [self.spec, other.spec]})
+
+    def __invert__(self) -> "Predicate":
+        return Predicate({"op": "not", "item": self.spec})
+
+
+def text_contains(text: str) -> Predicate:
+    """Item text contains the text"""
+    return Predicate({"op": "text", "value": text, "exact": False})
+
+
+def text_equals(text: str) -> Predicate:
+    """Item text equals the text"""
+    return Predicate({"op": "text", "value": text, "exact": True})
+
+
+def attribute_equals(name: str, value: str) -> Predicate:
+    """Item attribute has the value"""
+    return Predicate({"op": "attribute", "name": name, "value": value})
+
+
+def cell_equals(column: str | int, value: str) -> Predicate:
+    """Text of the row cell in the column equals the value
+
+    Args:
+        column: ag-grid col-id of the cell, or index of the cell among the row cells
+        value: Expected cell text
+    """
+    return Predicate({"op": "cell", "column": column, "value": value, "exact": True})
+
+
+def cell_contains(column: str | int, value: str) -> Predicate:
+    """Text of the row cell in the column contains the value, see cell_equals"""
+    return Predicate({"op": "cell", "column": column, "value": value, "exact": False})
+
+
+def visible(column: str | int | None = None) -> Predicate:
+    """Item is visible, or its cell in the column when given, see cell_equals"""
+    return Predicate({"op": "visible", "column": column})
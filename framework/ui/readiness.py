@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Literal
+
+from playwright.sync_api import Page
+
+from common.routes import match_ui_route
+
+STALE_ATTRIBUTE = "data-pw-stale"
+
+
+@dataclass(frozen=True)
+class ReadinessStrategy:
+    """App-specific signal that a page is ready to be used
+
+    Attributes:
+        wait_until: Load state Playwright waits for during goto
+        selector: Selector of an element whose visibility marks the page as ready
+        function: JS expression that becomes truthy when the page is ready
+    """
+
+    wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] = "load"
+    selector: str | None = None
+    function: str | None = None
+
+    def mark_stale(self, page: Page) -> None:
+        """Mark elements matching the ready selector, so a client-side navigation doesn't take them for the new page"""
+        if self.selector:
+            page.locator(self.selector).evaluate_all(f"(elements) => elements.forEach((el) => el.setAttribute('{STALE_ATTRIBUTE}', ''))")
+
+    def wait(self, page: Page, timeout: float | None = None, skip_stale: bool = False) -> None:
+        """Wait for the ready signal after goto returned
+
+        Args:
+            page: Page to wait on
+            timeout: Maximum time in milliseconds, the context default timeout if not set
+            skip_stale: Ignore elements marked by mark_stale
+        """
+        if self.selector:
+            selector = f":is({self.selector}):not([{STALE_ATTRIBUTE}])" if skip_stale else self.selector
+            page.wait_for_selector(selector, timeout=timeout)
+        if self.function:
+            page.wait_for_function(self.function, timeout=timeout)
+
+
+DEFAULT_READINESS = ReadinessStrategy()
+
+
+class ReadinessRegistry:
+    """Readiness strategies keyed by UIRoutes template"""
+
+    def __init__(self):
+        self._strategies: dict[str, ReadinessStrategy] = {}
+
+    def register(self, route: str, strategy: ReadinessStrategy) -> None:
+        """Set the readiness strategy for a UIRoutes template"""
+        self._strategies[route] = strategy
+
+    def get(self, url: str) -> ReadinessStrategy:
+        """Get the strategy for a URL, falling back to Playwright's load event"""
+        return self._strategies.get(match_ui_route(url), DEFAULT_READINESS)
@@ -0,0 +1,100 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from playwright.sync_api import Locator
+
+# Reads everything ElementSnapshot holds in one evaluation. Disabled state follows Playwright's
+# is_enabled: native disabled form controls, controls in a disabled fieldset and aria-disabled.
+SNAPSHOT_SCRIPT = """
+(el) => {
+    const rect = el.getBoundingClientRect();
+    const style = window.getComputedStyle(el);
+    const visible = rect.width > 0 && rect.height > 0 && style.visibility !== "hidden";
+    const formControls = ["BUTTON", "INPUT", "SELECT", "TEXTAREA", "OPTION", "OPTGROUP"];
+    const disabled = (formControls.includes(el.tagName) && (el.disabled || !!el.closest("fieldset[disabled]")))
+        || !!el.closest("[aria-disabled='true']");
+    return {
+        text: el.textContent ?? "",
+        attributes: Object.fromEntries(Array.from(el.attributes, (attr) => [attr.name, attr.value])),
+        visible,
+        disabled,
+        box: visible ? { x: rect.x, y: rect.y, width: rect.width, height: rect.height } : null,
+    };
+}
+"""
+
+SNAPSHOT_ALL_SCRIPT = f"(elements) => elements.map({SNAPSHOT_SCRIPT.strip()})"
+
+# Cheaper variant for list items: no layout or style reads, so large lists stay fast
+ITEMS_SCRIPT = """
+(elements) => elements.map((el) => ({
+    text: el.textContent ?? "",
+    attributes: Object.fromEntries(Array.from(el.attributes, (attr) => [attr.name, attr.value])),
+}))
+"""
+
+
+@dataclass(frozen=True)
+class ElementSnapshot:
+    """State of an element read at one moment
+
+    Attributes:
+        text: Text content of the element
+        attributes: Attribute values by name
+        classes: CSS classes of the element
+        visible: Whether the element is visible
+        enabled: Whether the element is enabled and has no "disabled" class, as BaseElement.is_enabled
+        bounding_box: Box relative to the viewport, None for invisible elements
+    """
+
+    text: str
+    attributes: Mapping[str, str]
+    classes: tuple[str, ...]
+    visible: bool
+    enabled: bool
+    bounding_box: Mapping[str, float] | None
+
+    @classmethod
+    def from_script(cls, data: dict[str, Any]) -> "ElementSnapshot":
+        """Build a snapshot from the result of SNAPSHOT_SCRIPT"""
+        classes = tuple(data["attributes"].get("class", "").split())
+        return cls(
+            text=data["text"],
+            attributes=MappingProxyType(data["attributes"]),
+            classes=classes,
+            visible=data["visible"],
+            enabled=not data["disabled"] and "disabled" not in classes,
+            bounding_box=MappingProxyType(data["box"]) if data["box"] else None,
+        )
+
+    def get_attribute(self, attribute_name: str) -> str:
+        """Get an attribute value, or empty string if the element has no such attribute"""
+        return self.attributes.get(attribute_name, "")
+
+
+@dataclass(frozen=True)
+class ItemSnapshot:
+    """Text and attributes of a list item read together with the other items
+
+    Attributes:
+        index: Position of the item in the list
+        text: Text content of the item
+        attributes: Attribute values by name
+        source: Locator of the whole list, the item locator is derived from it on demand
+    """
+
+    index: int
+    text: str
+    attributes: Mapping[str, str]
+    source: Locator
+
+    @property
+    def locator(self) -> Locator:
+        """Locator of the item, to interact with it"""
+        return self.source.nth(self.index)
+
+    def get_attribute(self, attribute_name: str) -> str:
+        """Get an attribute value, or empty string if the item has no such attribute"""
+        return self.attributes.get(attribute_name, "")
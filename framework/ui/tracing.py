@@ -0,0 +1,69 @@
+import re
+from pathlib import Path
+from weakref import WeakSet
+
+from playwright.sync_api import BrowserContext
+
+from config import base_settings
+from framework.ui.browser_pool import get_worker_id
+
+
+class TraceRecorder:
+    """Failure-only Playwright tracing split into one chunk per test
+
+    Tracing is started once per context and every test records its own chunk. A chunk
+    is written to disk only when it is kept (failed or slow test), otherwise it is dropped
+    by the browser without any I/O. Saved traces form a ring buffer: only the newest
+    max_files traces are kept in the trace directory.
+    """
+
+    def __init__(self, enabled: bool | None = None, trace_dir: Path | None = None, max_files: int | None = None):
+        self.enabled = base_settings.trace_on_failure if enabled is None else enabled
+        self.trace_dir = trace_dir or Path(base_settings.trace_dir)
+        self.max_files = base_settings.trace_max_files if max_files is None else max_files
+        self._contexts: WeakSet[BrowserContext] = WeakSet()
+        self._chunk_context: BrowserContext | None = None
+
+    def install(self, context: BrowserContext) -> None:
+        """Start tracing on a context, once per context"""
+        if not self.enabled or context in self._contexts:
+            return
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        self._contexts.add(context)
+
+    def start_chunk(self, context: BrowserContext, title: str) -> None:
+        """Start recording a chunk for a test"""
+        if context not in self._contexts:
+            return
+        context.tracing.start_chunk(title=title)
+        self._chunk_context = context
+
+    def stop_chunk(self, title: str, keep: bool) -> Path | None:
+        """Stop the current chunk, writing it to disk only if it should be kept
+
+        Args:
+            title: Test name used for the trace file name
+            keep: Save the chunk, e.g. when the test failed or was slow
+
+        Returns:
+            Path of the saved trace, or None if the chunk was discarded
+        """
+        context, self._chunk_context = self._chunk_context, None
+        if context is None:
+            return None
+
+        path = None
+        if keep:
+            self.trace_dir.mkdir(parents=True, exist_ok=True)
+            file_name = re.sub(r"[^\w.-]+", "_", f"{get_worker_id()}_{title}")
+            path = self.trace_dir / f"{file_name}.zip"
+        context.tracing.stop_chunk(path=path)
+
+        if path:
+            self._prune()
+        return path
+
+    def _prune(self) -> None:
+        traces = sorted(self.trace_dir.glob("*.zip"), key=lambda trace: trace.stat().st_mtime)
+        for trace in traces[: max(len(traces) - self.max_files, 0)]:
+            trace.unlink(missing_ok=True)
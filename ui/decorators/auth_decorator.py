@@ -67,9 +67,9 @@ def with_auth(role: UserRole = UserRole.ADMIN):
             login_page = LoginPage()
             login_page.open()
 
-            # Get credentials for the specified role
+            # Get credentials for the specified role, the UI login is skipped if a valid state is cached
             username, password = _get_credentials(role)
-            login_page.login(username, password)
+            login_page.login_with_cached_state(role.name, username, password)
 
             # Verify successful login
             login_page.should_be_redirected_from_login()
@@ -1,8 +1,93 @@
+import contextlib
+import logging
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from playwright.sync_api import Error, Locator
+
 from framework.ui.element import BaseElement, By, Element
+from framework.ui.list_elements import ListElement
+from framework.ui.predicates import Predicate
+from framework.ui.readiness import ReadinessStrategy
 
 ATTR_ROW_INDEX = "row-index"
 ATTR_ROW_ID = "row-id"
 ATTR_COL_ID = "col-id"
+# Upper bound of the best-effort wait for the grid DOM to settle, in milliseconds
+GRID_SETTLE_TIMEOUT = 2000
+
+logger = logging.getLogger(__name__)
+
+# Scrolls the grid viewports to the position, waits until ag-grid has rendered the rows and
+# columns there and reads the cell texts of the rendered body rows, pinned columns included.
+SCROLL_AND_READ_SCRIPT = """
+async (root, { top, left, colIds, settle, timeout }) => {
+    const vertical = root.querySelector(".ag-body-viewport");
+    if (!vertical) return null;
+    const horizontal =
+        root.querySelector(".ag-body-horizontal-scroll-viewport") ?? root.querySelector(".ag-center-cols-viewport");
+    const moved = vertical.scrollTop !== top || (!!horizontal && horizontal.scrollLeft !== left);
+    vertical.scrollTop = top;
+    if (horizontal) horizontal.scrollLeft = left;
+    if (moved) {
+        // Rendering follows the scroll event asynchronously, it is done once the grid stops changing
+        await new Promise((resolve) => {
+            let idleTimer = setTimeout(() => finish(), settle);
+            const finish = () => {
+                observer.disconnect();
+                clearTimeout(idleTimer);
+                clearTimeout(timer);
+                resolve();
+            };
+            const observer = new MutationObserver(() => {
+                clearTimeout(idleTimer);
+                idleTimer = setTimeout(finish, settle);
+            });
+            const timer = setTimeout(finish, timeout);
+            observer.observe(root, { subtree: true, childList: true, attributes: true, characterData: true });
+        });
+    }
+    const normalize = (text) => (text ?? "").replace(/\\s+/g, " ").trim();
+    const rows = new Map();
+    for (const row of root.querySelectorAll(".ag-body [role='row'][row-index]")) {
+        const index = Number(row.getAttribute("row-index"));
+        if (!Number.isInteger(index)) continue;
+        // Pinned containers render the same row again, with the same row-id
+        const id = row.getAttribute("row-id") ?? `index-${index}`;
+        if (!rows.has(id)) rows.set(id, { index, id, cells: {} });
+        const cells = rows.get(id).cells;
+        for (const cell of row.querySelectorAll("[role='gridcell'][col-id]")) {
+            const colId = cell.getAttribute("col-id");
+            if (!colIds || colIds.includes(colId)) cells[colId] = normalize(cell.textContent);
+        }
+    }
+    return {
+        rows: Array.from(rows.values()),
+        top: vertical.scrollTop,
+        height: vertical.clientHeight,
+        end: vertical.scrollTop + vertical.clientHeight >= vertical.scrollHeight - 1,
+        maxLeft: horizontal ? Math.max(horizontal.scrollWidth - horizontal.clientWidth, 0) : 0,
+        width: horizontal ? horizontal.clientWidth : 0,
+    };
+}
+"""
+
+
+@dataclass(frozen=True)
+class GridRowData:
+    """Cell texts of a grid row collected across all columns
+
+    Attributes:
+        row_id: ag-grid row-id of the row
+        row_index: Position of the row in the sorted and filtered grid
+        cells: Normalized cell texts by col-id
+    """
+
+    row_id: str
+    row_index: int
+    cells: Mapping[str, str]
 
 
 class AgGridHelper:
@@ -20,6 +105,33 @@ class AgGridHelper:
     loc_grid_body_row = "[role='row']"
     loc_grid_body_cell = "[role='gridcell']"
 
+    loc_grid_no_rows_overlay = ".ag-overlay-no-rows-center"
+    loc_grid_loading_overlay = ".ag-overlay-loading-center"
+
+    @classmethod
+    def get_readiness(cls, container: str) -> ReadinessStrategy:
+        """Readiness strategy that resolves when the grid inside the container renders its data
+
+        The page is ready as soon as the first body row is shown, or the "no rows" overlay
+        once the loading overlay is gone, without waiting for the load event of the document.
+        A grid created with empty row data shows the "no rows" overlay without a loading
+        overlay before its data request returns, so pages still wait for the grid to finish
+        loading with wait_for_grid_loading_to_finish before reading it.
+
+        Args:
+            container: CSS selector of the element containing the grid
+
+        Returns:
+            Readiness strategy for Driver.goto
+        """
+        return ReadinessStrategy(
+            wait_until="commit",
+            selector=(
+                f"{container} {cls.loc_grid_body_container} {cls.loc_grid_body_row}, "
+                f"{container}:not(:has({cls.loc_grid_loading_overlay})) {cls.loc_grid_no_rows_overlay}"
+            ),
+        )
+
     def get_grid_container(self, parent: BaseElement | None = None) -> BaseElement:
         return Element(By.LOCATOR, self.loc_grid_container, parent=parent)
 
@@ -33,18 +145,19 @@ class AgGridHelper:
             Self for method chaining
         """
         # Check for loading indicator disappearance (if present)
-        loading_indicator = Element(By.LOCATOR, ".ag-overlay-loading-center", parent=grid_container)
+        loading_indicator = Element(By.LOCATOR, self.loc_grid_loading_overlay, parent=grid_container)
         try:
             loading_indicator.should_be_visible(should_visible=False, timeout=5000)
         except Exception:
             # If there's no loading indicator, that's fine, continue
             pass
 
-        # Ensure rows are stable (present or absent as expected)
-        # Wait a short time for grid stabilization
-        import time
-
-        time.sleep(0.5)
+        # Give the rows a moment to settle: no DOM changes in the grid for a short while. Spinners,
+        # cell flashes and animations may keep the grid changing, so this never fails the test
+        try:
+            grid_container.wait_for_stable(timeout=GRID_SETTLE_TIMEOUT)
+        except AssertionError:
+            logger.info("Grid kept changing for %s ms, continuing", GRID_SETTLE_TIMEOUT)
 
         return self
 
@@ -72,6 +185,73 @@ class AgGridHelper:
     def get_grid_body_row_by_row_id(self, row_id: str, parent: BaseElement | None = None) -> BaseElement:
         return self.get_grid_body_container(parent).chain(Element(By.LOCATOR, f"[{ATTR_ROW_ID}='{row_id}']"))
 
+    def find_row(self, predicate: Predicate, parent: BaseElement | None = None) -> BaseElement | None:
+        """Find the first rendered body row matching the predicate with a single query in the page
+
+        Args:
+            predicate: Row condition, e.g. cell_equals(col_id, value) or text_contains(text)
+            parent: Element containing the grid
+
+        Returns:
+            The row element located by its row-id, or None if no row matches
+        """
+        rows = ListElement(By.LOCATOR, self.loc_grid_body_row, lambda loc, idx: loc, self.get_grid_body_container(parent))
+        matches = rows.query(predicate, first=True)
+        return self.get_grid_body_row_by_row_id(matches[0].get_attribute(ATTR_ROW_ID), parent) if matches else None
+
+    @staticmethod
+    def _scroll_and_read(container: Locator, top: float, left: float, col_ids: Sequence[str] | None) -> dict[str, Any] | None:
+        arg = {"top": top, "left": left, "colIds": list(col_ids) if col_ids else None, "settle": 50, "timeout": GRID_SETTLE_TIMEOUT}
+        return container.evaluate(SCROLL_AND_READ_SCRIPT, arg)
+
+    def iter_rows(self, parent: BaseElement | None = None, col_ids: Sequence[str] | None = None) -> Iterator[GridRowData]:
+        """Iterate over all rows of the grid, including the ones ag-grid doesn't render yet
+
+        ag-grid renders only the rows and columns inside the viewport. The viewport is moved
+        down one screen at a time and swept horizontally at each position, so every row is
+        yielded once with the cells of all columns. Only the rows of the current screen and
+        the ids of the rows already yielded are held. Rows are told apart by their row-id,
+        which stays with a row when ag-grid re-indexes the rows. The grid must not be sorted
+        or filtered during the iteration. Leaving the loop early stops the scrolling, and the
+        grid is scrolled back to the top left in either case.
+
+        Args:
+            parent: Element containing the grid
+            col_ids: Columns to read, all columns if not set
+
+        Yields:
+            The rows in grid order
+        """
+        container = self.get_grid_container(parent)._get_locator()
+        seen_ids: set[str] = set()
+        try:
+            step = self._scroll_and_read(container, 0, 0, col_ids)
+            if step is None:
+                return
+            # Horizontal positions covering all columns, swept alternately in both directions
+            lefts = list(range(0, int(step["maxLeft"]), step["width"])) + [step["maxLeft"]] if step["width"] else [0]
+            while True:
+                window: dict[str, dict[str, Any]] = {}
+                for index, left in enumerate(lefts):
+                    if index:
+                        step = self._scroll_and_read(container, step["top"], left, col_ids)
+                    for row in step["rows"]:
+                        if row["id"] not in seen_ids:
+                            window.setdefault(row["id"], {"index": row["index"], "cells": {}})["cells"].update(row["cells"])
+
+                for row_id, row in sorted(window.items(), key=lambda item: item[1]["index"]):
+                    seen_ids.add(row_id)
+                    yield GridRowData(row_id=row_id, row_index=row["index"], cells=MappingProxyType(row["cells"]))
+
+                if step["end"]:
+                    return
+                lefts.reverse()
+                step = self._scroll_and_read(container, step["top"] + step["height"], lefts[0], col_ids)
+        finally:
+            # The page may be gone when the caller stopped because of a failure
+            with contextlib.suppress(Error):
+                self._scroll_and_read(container, 0, 0, col_ids)
+
     def get_grid_body_row_position(self, position: int, parent: BaseElement | None = None) -> BaseElement:
         return self.get_grid_body_container(parent).chain(Element(By.LOCATOR, f"[role='row']:nth-child({position})"))
 
@@ -1,13 +1,41 @@
+import functools
+
 from playwright.sync_api import Page
 
 from framework.ui.driver import Driver
+from framework.ui.readiness import ReadinessStrategy
+
+
+def page_action(method):
+    """Mark a page-object method as a user action, sampled by Driver.page_metrics when enabled
+
+    Only the outermost action is sampled when decorated actions call each other.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not Driver.page_metrics.enabled:
+            return method(self, *args, **kwargs)
+        with Driver.page_metrics.measure(Driver.get_driver, f"{type(self).__name__}.{method.__name__}"):
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class BasePage:
     """Base class for all pages"""
 
     url: str = None
+    # UIRoutes template of the page and the signal Driver.goto waits for on it
+    route: str | None = None
+    readiness: ReadinessStrategy | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.route and cls.readiness:
+            Driver.readiness.register(cls.route, cls.readiness)
 
+    @page_action
     def open(self):
         """Open the page"""
         Driver.goto(self.url)
@@ -3,8 +3,9 @@ from enum import Enum, auto
 from common.decorators import ui_url
 from common.routes import UIRoutes
 from config import base_settings
+from framework.ui.driver import Driver
 from framework.ui.element import By, Element
-from ui.pages.base_page import BasePage
+from ui.pages.base_page import BasePage, page_action
 
 
 class UserType(Enum):
@@ -25,6 +26,7 @@ class LoginPage(BasePage):
 
     error_toast = Element(By.LOCATOR, ".Toastify__toast--error")
 
+    @page_action
     def login(self, login: str, password: str, check_already_logged_in: bool = True):
         """Login with the specified credentials
 
@@ -68,7 +70,42 @@ class LoginPage(BasePage):
             UserType.READONLY: (base_settings.readonly_username, base_settings.readonly_password),
         }
         username, password = credentials[user_type]
-        return self.login(username, password, check_already_logged_in)
+        return self.login_with_cached_state(user_type.name, username, password, check_already_logged_in)
+
+    @page_action
+    def login_with_cached_state(self, role: str, login: str, password: str, check_already_logged_in: bool = True):
+        """Restore a cached authentication state for the role or login through the UI and cache it
+
+        The cache is shared with parallel workers, so only one of them performs the UI login
+        for a role while the others wait and reuse the stored state.
+
+        Args:
+            role: Role name used as the cache key, e.g. "ADMIN"
+            login: Username or email used when no valid state is cached
+            password: User password used when no valid state is cached
+            check_already_logged_in: If True, will check if already logged in and skip login if so
+
+        Returns:
+            Self for method chaining
+        """
+        if check_already_logged_in and self.is_user_logged_in():
+            print("User is already logged in, skipping login")
+            return self
+
+        with Driver.auth_cache.lock(role):
+            if Driver.restore_auth_state(role):
+                self.get_page().reload()
+                try:
+                    self.el_user_menu.should_be_visible(timeout=5000)
+                    return self
+                except AssertionError:
+                    # The session was revoked on the server side, login again
+                    Driver.auth_cache.invalidate(role)
+
+            self.login(login, password, check_already_logged_in=False)
+            self.should_be_redirected_from_login()
+            Driver.set_auth_state(role)
+        return self
 
     def is_user_logged_in(self) -> bool:
         """Check if any user is currently logged in
@@ -88,6 +125,7 @@ class LoginPage(BasePage):
 
         return self
 
+    @page_action
     def logout(self):
         """Logout the current user if logged in
 
@@ -1,9 +1,11 @@
 from faker import Faker
 
+from common.routes import UIRoutes
 from framework.ui.element import By, Element, BaseElement
+from framework.ui.predicates import cell_contains, visible
 from ui.helpers.ag_grid_helper import AgGridHelper
 from ui.helpers.url_helper import UrlHelper
-from ui.pages.base_page import BasePage
+from ui.pages.base_page import BasePage, page_action
 from ui.pages.tax_depreciation.components.asset_class_dialog import AssetClassDialog
 
 fake = Faker()
@@ -14,6 +16,8 @@ class AssetClassPage(BasePage):
 
     # The URL is set dynamically when opening the page
     url = None
+    route = UIRoutes.DEPRECIATION_ASSET_CLASS
+    readiness = AgGridHelper.get_readiness(".configuration-table")
 
     # Page elements
     title_element = Element(By.LOCATOR, "h3:has-text('Asset Class')")
@@ -38,6 +42,7 @@ class AssetClassPage(BasePage):
         self.ag_grid = AgGridHelper()
         self.asset_class_dialog = AssetClassDialog()
 
+    @page_action
     def open_with_id(self, depr_case_id: str):
         """Open the asset class page with the given depreciation ID"""
         self.url = UrlHelper.depreciation_asset_class(depr_case_id)
@@ -47,6 +52,8 @@ class AssetClassPage(BasePage):
         """Check if the page is loaded successfully"""
         self.title_element.should_be_visible()
         self.grid_container.should_be_visible()
+        # The readiness strategy may accept the "no rows" overlay shown before the data arrives
+        self.wait_for_grid_reload()
         return True
 
     def verify_grid_headers(self, expected_headers):
@@ -57,6 +64,7 @@ class AssetClassPage(BasePage):
             assert header in actual_headers, f"Header '{header}' not found in grid headers: {actual_headers}"
         return self
 
+    @page_action
     def click_create_button(self):
         """Click the Create button to open the asset class creation form"""
         self.create_button.click()
@@ -74,6 +82,7 @@ class AssetClassPage(BasePage):
         """
         return self.asset_class_dialog.fill_form(name)
 
+    @page_action
     def submit_form(self):
         """Submit the asset class form"""
         self.asset_class_dialog.create()
@@ -94,10 +103,9 @@ class AssetClassPage(BasePage):
         # Wait for grid to fully load
         self.grid_container.should_be_visible()
 
-        for row in self.ag_grid.get_grid_body_rows().all():
-            if self.ag_grid.get_cell_by_row_and_text(name, row).is_visible():
-                return True
-        return False
+        # The rows are matched in the page by the text of their visible name cell
+        predicate = cell_contains(self.col_id_name, name) & visible(self.col_id_name)
+        return self.ag_grid.find_row(predicate, self.grid_container) is not None
 
     def select_first_row(self) -> BaseElement:
         self.grid_container.should_be_visible()
@@ -112,6 +120,7 @@ class AssetClassPage(BasePage):
     def get_actions_cell(self, row):
         return self.ag_grid.get_grid_body_row_cell_by_col_id(row, self.col_id_actions)
 
+    @page_action
     def click_edit_icon(self, actions_cell: BaseElement):
         """Click the edit icon that appears when hovering over Actions cell
 
@@ -140,6 +149,7 @@ class AssetClassPage(BasePage):
         self.asset_class_dialog.name_input.fill(new_name)
         return self, current_name
 
+    @page_action
     def save_edited_form(self):
         """Save the edited form by clicking the Save button
 
@@ -150,6 +160,7 @@ class AssetClassPage(BasePage):
         self.asset_class_dialog.should_not_be_visible()
         return self
 
+    @page_action
     def click_delete_icon(self, actions_cell: BaseElement):
         """Click the delete icon that appears in the Actions cell
 
@@ -182,6 +193,7 @@ class AssetClassPage(BasePage):
 
         return self
 
+    @page_action
     def confirm_delete(self):
         """Confirm deletion by clicking the Delete button in the confirmation popup
 
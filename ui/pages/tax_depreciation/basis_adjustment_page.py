@@ -1,9 +1,11 @@
 from faker import Faker
 
+from common.routes import UIRoutes
 from framework.ui.element import By, Element, BaseElement
+from framework.ui.predicates import cell_contains, visible
 from ui.helpers.ag_grid_helper import AgGridHelper
 from ui.helpers.url_helper import UrlHelper
-from ui.pages.base_page import BasePage
+from ui.pages.base_page import BasePage, page_action
 from ui.pages.tax_depreciation.components.basis_adjustment_dialog import BasisAdjustmentDialog
 
 fake = Faker()
@@ -14,6 +16,8 @@ class BasisAdjustmentPage(BasePage):
 
     # The URL is set dynamically when opening the page
     url = None
+    route = UIRoutes.DEPRECIATION_BASIS_ADJUSTMENT
+    readiness = AgGridHelper.get_readiness(".configuration-table")
 
     # Page elements
     title_element = Element(By.LOCATOR, "h3:has-text('Basis Adjustment')")
@@ -38,6 +42,7 @@ class BasisAdjustmentPage(BasePage):
         self.ag_grid = AgGridHelper()
         self.basis_adjustment_dialog = BasisAdjustmentDialog()
 
+    @page_action
     def open_with_id(self, depr_case_id: str):
         """Open the basis adjustment page with the given depreciation ID"""
         self.url = UrlHelper.depreciation_basis_adjustment(depr_case_id)
@@ -47,6 +52,8 @@ class BasisAdjustmentPage(BasePage):
         """Check if the page is loaded successfully"""
         self.title_element.should_be_visible()
         self.grid_container.should_be_visible()
+        # The readiness strategy may accept the "no rows" overlay shown before the data arrives
+        self.wait_for_grid_reload()
         return True
 
     def verify_grid_headers(self, expected_headers):
@@ -57,6 +64,7 @@ class BasisAdjustmentPage(BasePage):
             assert header in actual_headers, f"Header '{header}' not found in grid headers: {actual_headers}"
         return self
 
+    @page_action
     def click_create_button(self):
         """Click the Create button to open the basis adjustment creation form"""
         self.create_button.click()
@@ -74,6 +82,7 @@ class BasisAdjustmentPage(BasePage):
         """
         return self.basis_adjustment_dialog.fill_form(name)
 
+    @page_action
     def submit_form(self):
         """Submit the basis adjustment form"""
         self.basis_adjustment_dialog.create()
@@ -100,10 +109,9 @@ class BasisAdjustmentPage(BasePage):
         # Wait for grid to fully load
         self.grid_container.should_be_visible()
 
-        for row in self.ag_grid.get_grid_body_rows().all():
-            if self.ag_grid.get_cell_by_row_and_text(name, row).is_visible():
-                return True
-        return False
+        # The rows are matched in the page by the text of their visible name cell
+        predicate = cell_contains(self.col_id_name, name) & visible(self.col_id_name)
+        return self.ag_grid.find_row(predicate, self.grid_container) is not None
 
     def select_first_row(self) -> BaseElement:
         """Select the first row in the grid"""
@@ -119,6 +127,7 @@ class BasisAdjustmentPage(BasePage):
         """Get the actions cell for a row"""
         return self.ag_grid.get_grid_body_row_cell_by_col_id(row, self.col_id_actions)
 
+    @page_action
     def click_edit_icon(self, actions_cell: BaseElement):
         """Click the edit icon that appears when hovering over Actions cell
 
@@ -146,6 +155,7 @@ class BasisAdjustmentPage(BasePage):
         self.basis_adjustment_dialog.name_input.fill(new_name)
         return self, current_name
 
+    @page_action
     def save_edited_form(self):
         """Save the edited form by clicking the Save button
 
@@ -156,6 +166,7 @@ class BasisAdjustmentPage(BasePage):
         self.basis_adjustment_dialog.should_not_be_visible()
         return self
 
+    @page_action
     def click_delete_icon(self, actions_cell: BaseElement):
         """Click the delete icon that appears in the Actions cell
 
@@ -186,6 +197,7 @@ class BasisAdjustmentPage(BasePage):
         self.confirmation_delete_button.should_be_enabled()
         return self
 
+    @page_action
     def confirm_delete(self):
         """Confirm deletion by clicking the Delete button in the confirmation popup
 
@@ -1,5 +1,7 @@
+from common.routes import UIRoutes
 from framework.ui.element import Element, By, BaseElement
-from ui.pages.base_page import BasePage
+from framework.ui.predicates import cell_contains, visible
+from ui.pages.base_page import BasePage, page_action
 from ui.helpers.ag_grid_helper import AgGridHelper
 from ui.helpers.url_helper import UrlHelper
 from ui.pages.tax_depreciation.components.bonus_profile_dialog import BonusProfileDialog
@@ -10,6 +12,8 @@ class BonusProfilePage(BasePage):
 
     # The URL is set dynamically when opening the page
     url = None
+    route = UIRoutes.DEPRECIATION_BONUS_PROFILE
+    readiness = AgGridHelper.get_readiness(".configuration-table")
 
     # Page elements
     title_element = Element(By.LOCATOR, "h3:has-text('Bonus Profile')")
@@ -37,6 +41,7 @@ class BonusProfilePage(BasePage):
         self.ag_grid = AgGridHelper()
         self.bonus_profile_dialog = BonusProfileDialog()
 
+    @page_action
     def open_with_id(self, depr_case_id: str):
         """Open the bonus profile page with the given depreciation ID"""
         self.url = UrlHelper.depreciation_bonus_profile(depr_case_id)
@@ -46,6 +51,7 @@ class BonusProfilePage(BasePage):
         """Check if the page is loaded successfully"""
         self.title_element.should_be_visible()
         self.grid_container.should_be_visible()
+        # The readiness strategy may accept the "no rows" overlay shown before the data arrives
         self.wait_for_grid_reload()
         return True
 
@@ -64,6 +70,7 @@ class BonusProfilePage(BasePage):
             assert header in actual_headers, f"Header '{header}' not found in grid headers: {actual_headers}"
         return self
 
+    @page_action
     def click_create_button(self):
         """Click the Create button to open the bonus profile creation form"""
         self.create_button.click()
@@ -83,6 +90,7 @@ class BonusProfilePage(BasePage):
         """
         return self.bonus_profile_dialog.fill_form(name, bonus_calculation_method, bonus_percent)
 
+    @page_action
     def submit_form(self):
         """Submit the bonus profile form"""
         self.bonus_profile_dialog.create()
@@ -103,10 +111,9 @@ class BonusProfilePage(BasePage):
         # Wait for grid to fully load
         self.grid_container.should_be_visible()
 
-        for row in self.ag_grid.get_grid_body_rows().all():
-            if self.ag_grid.get_cell_by_row_and_text(name, row).is_visible():
-                return True
-        return False
+        # The rows are matched in the page by the text of their visible name cell
+        predicate = cell_contains(self.col_id_name, name) & visible(self.col_id_name)
+        return self.ag_grid.find_row(predicate, self.grid_container) is not None
 
     def select_first_row(self) -> BaseElement:
         """Select the first row in the grid
@@ -164,6 +171,7 @@ class BonusProfilePage(BasePage):
         """
         return self.ag_grid.get_grid_body_row_cell_by_col_id(row, self.col_id_actions)
 
+    @page_action
     def click_edit_icon(self, actions_cell: BaseElement):
         """Click the edit icon that appears when hovering over Actions cell
 
@@ -209,6 +217,7 @@ class BonusProfilePage(BasePage):
         self.bonus_profile_dialog.bonus_percent_input.fill(str(new_percent))
         return self, current_percent
 
+    @page_action
     def save_edited_form(self):
         """Save the edited form by clicking the Save button
 
@@ -219,6 +228,7 @@ class BonusProfilePage(BasePage):
         self.bonus_profile_dialog.should_not_be_visible()
         return self
 
+    @page_action
     def click_delete_icon(self, actions_cell: BaseElement):
         """Click the delete icon that appears in the Actions cell
 
@@ -251,6 +261,7 @@ class BonusProfilePage(BasePage):
 
         return self
 
+    @page_action
     def confirm_delete(self):
         """Confirm deletion by clicking the Delete button in the confirmation popup
 
@@ -35,27 +35,17 @@ class ContactDialog:
         user_id: str | None = None,
     ):
         """Fill the contact form"""
-        if first_name is not None:
-            self.first_name_input.fill(first_name)
-
-        if last_name is not None:
-            self.last_name_input.fill(last_name)
-
-        if email is not None:
-            self.email_input.fill(email)
-
-        if phone is not None:
-            self.phone_input.fill(phone)
-
-        if address is not None:
-            self.address_input.fill(address)
-
-        if notes is not None:
-            self.notes_input.fill(notes)
-
-        if user_id is not None:
-            # Select option by value
-            self.user_select._get_locator().select_option(value=user_id)
+        fields = {
+            "firstName": first_name,
+            "lastName": last_name,
+            "email": email,
+            "phone": phone,
+            "address": address,
+            "notes": notes,
+            "userId": user_id,
+        }
+        # Plain inputs and the native user select are set in one evaluation
+        self.dialog.fill_fields({name: value for name, value in fields.items() if value is not None})
 
         return self
 
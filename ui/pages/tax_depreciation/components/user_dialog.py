@@ -35,29 +35,17 @@ class UserDialog:
         is_active: bool | None = None,
     ):
         """Fill the user form"""
-        if username is not None:
-            self.username_input.fill(username)
-
-        if email is not None:
-            self.email_input.fill(email)
-
-        if first_name is not None:
-            self.first_name_input.fill(first_name)
-
-        if last_name is not None:
-            self.last_name_input.fill(last_name)
-
-        if password is not None:
-            self.password_input.fill(password)
-
-        if phone is not None:
-            self.phone_input.fill(phone)
-
-        if is_active is not None:
-            if is_active and not self.active_checkbox._get_locator().is_checked():
-                self.active_checkbox.check()
-            elif not is_active and self.active_checkbox._get_locator().is_checked():
-                self.active_checkbox.uncheck()
+        fields = {
+            "username": username,
+            "email": email,
+            "firstName": first_name,
+            "lastName": last_name,
+            "password": password,
+            "phone": phone,
+            "isActive": is_active,
+        }
+        # Plain inputs and the active checkbox are set in one evaluation
+        self.dialog.fill_fields({name: value for name, value in fields.items() if value is not None})
 
         return self
 
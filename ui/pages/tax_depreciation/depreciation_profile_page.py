@@ -1,6 +1,8 @@
+from common.routes import UIRoutes
 from framework.ui.element import Element, By
-from ui.pages.base_page import BasePage
-from ui.helpers.ag_grid_helper import AgGridHelper
+from framework.ui.predicates import cell_contains, visible
+from ui.pages.base_page import BasePage, page_action
+from ui.helpers.ag_grid_helper import AgGridHelper, GridRowData
 from ui.helpers.url_helper import UrlHelper
 from ui.pages.tax_depreciation.components.depreciation_profile_dialog import DepreciationProfileDialog
 
@@ -10,6 +12,8 @@ class DepreciationProfilePage(BasePage):
 
     # The URL is set dynamically when opening the page
     url = None
+    route = UIRoutes.DEPRECIATION_PROFILE
+    readiness = AgGridHelper.get_readiness(".configuration-table")
 
     # Page elements
     title_element = Element(By.LOCATOR, "h3:has-text('Depreciation Profile')")
@@ -45,6 +49,7 @@ class DepreciationProfilePage(BasePage):
         self.ag_grid = AgGridHelper()
         self.depreciation_profile_dialog = DepreciationProfileDialog()
 
+    @page_action
     def open_with_id(self, depr_case_id: str):
         """Open the depreciation profile page with the given depreciation ID"""
         self.url = UrlHelper.depreciation_profile(depr_case_id)
@@ -62,6 +67,7 @@ class DepreciationProfilePage(BasePage):
         """Check if the page is loaded successfully"""
         self.title_element.should_be_visible()
         self.grid_container.should_be_visible()
+        # The readiness strategy may accept the "no rows" overlay shown before the data arrives
         self.wait_for_grid_reload()
         return True
 
@@ -131,6 +137,7 @@ class DepreciationProfilePage(BasePage):
         """
         return self.ag_grid.get_cell_by_col_id(row, self.col_id_actions)
 
+    @page_action
     def click_edit_icon(self, actions_cell):
         """Click the edit icon in the actions cell
 
@@ -148,6 +155,7 @@ class DepreciationProfilePage(BasePage):
         edit_icon.click()
         return self
 
+    @page_action
     def click_delete_icon(self, actions_cell):
         """Click the delete icon in the actions cell
 
@@ -183,6 +191,7 @@ class DepreciationProfilePage(BasePage):
         assert self.confirmation_delete_button.is_enabled(), "Delete button should be enabled"
         return self
 
+    @page_action
     def confirm_delete(self):
         """Confirm deletion by clicking the Delete button in the confirmation popup
 
@@ -206,6 +215,7 @@ class DepreciationProfilePage(BasePage):
         assert "Successfully Deleted" in message_text, f"Expected success message to contain 'Successfully Deleted', got '{message_text}'"
         return self
 
+    @page_action
     def click_create_button(self):
         """Click the Create button to open the form
 
@@ -226,6 +236,7 @@ class DepreciationProfilePage(BasePage):
         """
         return self.depreciation_profile_dialog.fill_form(name)
 
+    @page_action
     def submit_form(self):
         """Submit the form by clicking the Create button
 
@@ -256,6 +267,7 @@ class DepreciationProfilePage(BasePage):
         self.depreciation_profile_dialog.name_input.fill(new_name)
         return self
 
+    @page_action
     def save_edited_form(self):
         """Save the edited form by clicking the Save button
 
@@ -274,11 +286,23 @@ class DepreciationProfilePage(BasePage):
         Returns:
             True if the profile is found, False otherwise
         """
-        # Get all grid rows
-        rows = self.ag_grid.get_grid_body_rows(self.grid_container).all()
-        # Check if any row has the profile name
-        for row in rows:
-            name_cell = self.ag_grid.get_cell_by_col_id(row, self.col_id_name)
-            if profile_name in name_cell.get_text():
-                return True
-        return False
+        # The rows are matched in the page by the text of their visible name cell
+        predicate = cell_contains(self.col_id_name, profile_name) & visible(self.col_id_name)
+        return self.ag_grid.find_row(predicate, self.grid_container) is not None
+
+    def get_depreciation_profile_row(self, profile_name: str) -> GridRowData | None:
+        """Get the cell texts of all columns of a depreciation profile
+
+        The grid is scrolled through until the row is found, so rows and columns outside
+        the viewport are found as well.
+
+        Args:
+            profile_name: The exact name of the profile
+
+        Returns:
+            The row with its cell texts by col-id, or None if there is no such profile
+        """
+        for row in self.ag_grid.iter_rows(self.grid_container):
+            if row.cells.get(self.col_id_name) == profile_name:
+                return row
+        return None